@@ -1,61 +1,253 @@
+import hashlib
 import json
-import re
-from docx import Document
-from docx.text.paragraph import Paragraph
-from docx.table import Table
-from docx.oxml.table import CT_Tbl
-from docx.oxml.text.paragraph import CT_P
-
-# 문서 내의 모든 블록(단락, 표)을 순회하는 함수입니다.
-def iterBlockItems(parent):
-    # parent.element.body.iterchildren()의 각 child에 대해 반복합니다.
-    for child in parent.element.body.iterchildren():
-        if isinstance(child, CT_P):
-            yield Paragraph(child, parent)
-        elif isinstance(child, CT_Tbl):
-            yield Table(child, parent)
+import os
+
+# orjson 선택 의존성 (없으면 표준 json 사용)
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+# 객체와 UTF-8 JSON 바이트를 서로 변환하는 함수입니다.
+if _HAS_ORJSON:
+    _jsonBytes, _jsonLoads = orjson.dumps, orjson.loads
+else:
+    def _jsonBytes(obj):
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _jsonLoads = json.loads
+
+# WordprocessingML 네임스페이스입니다.
+NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+_BODY_TAG = f"{{{NS['w']}}}body"
+_P_TAG = f"{{{NS['w']}}}p"
+_TBL_TAG = f"{{{NS['w']}}}tbl"
+_T_TAG = f"{{{NS['w']}}}t"
+_BR_TAG = f"{{{NS['w']}}}br"
+_BR_TYPE_ATTR = f"{{{NS['w']}}}type"
+# 런(<w:r>) 안에서 텍스트 대신 문자로 바꿔 넣는 요소들입니다. (Paragraph.text 와 동일)
+# <w:br> 은 w:type 이 없거나 textWrapping 일 때만 \n 이고, 페이지/단 나누기는 빈 문자열입니다.
+_RUN_CHARS = {
+    f"{{{NS['w']}}}tab": "\t",
+    f"{{{NS['w']}}}ptab": "\t",
+    f"{{{NS['w']}}}cr": "\n",
+    f"{{{NS['w']}}}noBreakHyphen": "-",
+}
+
+# lxml 은 실제로 파싱할 때만 import 합니다. (캐시 적중 시 import 비용을 건너뜀)
+_etree = None
+_TR_XPATH = _TC_XPATH = _CELL_P_XPATH = _P_T_XPATH = None
+
+# lxml 을 import 하고 XPath 들을 컴파일하는 함수입니다.
+def _loadLxml():
+    global _etree, _TR_XPATH, _TC_XPATH, _CELL_P_XPATH, _P_T_XPATH
+    if _etree is not None:
+        return
+    from lxml import etree
+
+    # 표의 행(<w:tr>)과 행의 셀(<w:tc>)을 찾는 XPath입니다.
+    _TR_XPATH = etree.XPath("./w:tr", namespaces=NS)
+    _TC_XPATH = etree.XPath("./w:tc", namespaces=NS)
+    # 셀 바로 아래의 단락(<w:p>)을 찾는 XPath입니다. (python-docx 의 cell.paragraphs 와 동일)
+    _CELL_P_XPATH = etree.XPath("./w:p", namespaces=NS)
+    # 단락 자신의 런(<w:r>, 하이퍼링크 안의 <w:r>)에 있는 텍스트 노드(<w:t>)와 탭/줄바꿈 요소를
+    # 문서 순서대로 찾는 XPath입니다. (.// 로 찾으면 텍스트 상자의 Choice/Fallback 내용까지 중복으로 잡힘)
+    _P_T_XPATH = etree.XPath(
+        "|".join(f"{run}/w:{name}"
+                 for run in ("./w:r", "./w:hyperlink/w:r")
+                 for name in ("t", "tab", "ptab", "br", "cr", "noBreakHyphen")),
+        namespaces=NS)
+    _etree = etree
+
+# 문장 분리 시 \n 을 . 으로 바꾸기 위한 변환 테이블입니다.
+_NL_TO_DOT = str.maketrans("\n", ".")
+_NL_TO_DOT_BYTES = bytes.maketrans(b"\n", b".")
+# ASCII 범위에서 str.strip() 이 제거하는 공백 문자들입니다.
+_ASCII_WS = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+# 단락(<w:p>)의 텍스트를 Paragraph.text 와 같은 규칙으로 이어 붙이는 함수입니다.
+def _elementText(el):
+    parts = []
+    for t in _P_T_XPATH(el):
+        tag = t.tag
+        if tag == _T_TAG:
+            parts.append(t.text or "")
+        elif tag == _BR_TAG:
+            if t.get(_BR_TYPE_ATTR, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_CHARS[tag])
+    return "".join(parts)
+
+# 문서 본문(<w:body>)의 모든 블록(단락, 표)을 순회하는 함수입니다.
+# (단락 여부, 요소) 튜플을 반환합니다. 단락이면 True, 표이면 False 입니다.
+def iterBlockItems(source):
+    _loadLxml()
+    # 전체 DOM 을 만들지 않고 iterparse 로 단락/표가 닫힐 때마다 하나씩 처리합니다.
+    for _, el in _etree.iterparse(source, events=("end",), tag=(_P_TAG, _TBL_TAG)):
+        # 표 셀 안의 단락/표는 바깥 표가 닫힐 때 함께 처리하므로 건너뜁니다.
+        parent = el.getparent()
+        if parent is None or parent.tag != _BODY_TAG:
+            continue
+
+        yield el.tag == _P_TAG, el
+
+        # 처리가 끝난 블록과 그 앞의 형제 요소들을 지워 메모리를 일정하게 유지합니다.
+        el.clear()
+        while el.getprevious() is not None:
+            del parent[0]
 
 # 텍스트를 문장 단위로 분리하는 함수입니다.
 def splitSentences(text):
-    # . 또는 \n 을 기준으로 문장들을 분리합니다.
-    sentences = re.split(r"[.\n]", text)
+    # ASCII 전용 단락은 bytes 로 분리합니다. (str.strip() 과 같은 공백 집합 사용)
+    if text.isascii():
+        parts = text.encode("ascii").translate(_NL_TO_DOT_BYTES).split(b".")
+        return [p.decode("ascii") + "." for p in (p.strip(_ASCII_WS) for p in parts) if p]
+
+    # \n 을 . 으로 바꾼 뒤 . 을 기준으로 문장들을 분리합니다. (정규식 없이 C 수준에서 처리)
+    sentences = text.translate(_NL_TO_DOT).split(".")
 
     # 공백과 빈 문자열을 제거하고, 각 문장 뒤에 마침표를 다시 붙여서 반환합니다.
-    return [s.strip() + "." for s in sentences if s.strip()]
+    return [s + "." for s in map(str.strip, sentences) if s]
+
+# 셀 텍스트를 strip 하되, 같은 원문은 같은 문자열 객체를 재사용하는 함수를 만듭니다.
+# 표에 반복되는 셀 값("-", "N/A", 머리글 등)의 할당을 줄이기 위해 사용합니다.
+def _makeInternStrip():
+    internCache = {}
+
+    def internStrip(raw):
+        cell = internCache.get(raw)
+        if cell is None:
+            cell = internCache[raw] = raw.strip()
+        return cell
+
+    return internStrip
+
+# 표(<w:tbl>)의 각 행을 셀 텍스트 리스트로 반환하는 함수입니다.
+def _tableRows(tbl, internStrip):
+    # Table.rows / row.cells 는 병합 셀 구조를 매번 다시 계산하므로(큰 표에서 O(n²))
+    # <w:tr>, <w:tc> 요소를 직접 순회합니다.
+    for tr in _TR_XPATH(tbl):
+        # 각 셀(<w:tc>)의 단락들을 cell.text 처럼 \n 으로 이어 붙여 rowData 리스트에 저장합니다.
+        yield [internStrip("\n".join(_elementText(p) for p in _CELL_P_XPATH(tc))) for tc in _TC_XPATH(tr)]
 
 # docx 파일을 파싱하고 내용을 정리하는 함수입니다.
+# 문장/표 행을 하나씩 yield 하므로 문서 크기와 관계없이 메모리를 일정하게 사용합니다.
+# 리스트가 필요하면 list(parseDocxClean(...))로 호출합니다.
 def parseDocxClean(filePath):
-    doc = Document(filePath)
-    content = []
-
-    # 문서의 모든 블록을 순회합니다.
-    for block in iterBlockItems(doc):
-        # 블록이 단락인 경우입니다.
-        if isinstance(block, Paragraph):
-            text = block.text.strip()
-            if text:
-                content.extend(splitSentences(text))
-        # 블록이 표인 경우입니다.
-        elif isinstance(block, Table):
-            # 표를 직렬화(serialization)합니다.
-            # 각 행(row)을 순회합니다.
-            for row in block.rows:
-                # 각 셀(cell)의 텍스트를 가져와서 rowData 리스트에 저장합니다.
-                rowData = [cell.text.strip() for cell in row.cells]
-                # rowData에 내용이 있다면, " | "로 join하여 content 리스트에 추가합니다.
-                if any(rowData):
-                    content.append(" | ".join(rowData))
+    internStrip = _makeInternStrip()
+
+    # python-docx 의 Document 객체 그래프(스타일, 번호 매기기, 관계 등)를 만들지 않고
+    # docx(zip) 안의 word/document.xml 만 직접 읽습니다.
+    import zipfile
+    with zipfile.ZipFile(filePath) as z, z.open("word/document.xml") as f:
+        # 문서의 모든 블록을 순회합니다.
+        for isP, block in iterBlockItems(f):
+            # 블록이 단락인 경우입니다.
+            # (splitSentences 가 조각마다 strip 하고 빈 문장을 버리므로 미리 strip 하지 않습니다.)
+            if isP:
+                yield from splitSentences(_elementText(block))
+            # 블록이 표인 경우입니다.
+            else:
+                # 표를 직렬화(serialization)합니다.
+                for rowData in _tableRows(block, internStrip):
+                    # rowData에 내용이 있다면, " | "로 join하여 반환합니다.
+                    # 셀은 이미 strip 되어 있으므로 모든 셀이 비었으면 구분자 길이만 남습니다.
+                    # (any(rowData)로 셀을 한 번 더 훑지 않고 길이만 비교합니다.)
+                    row = " | ".join(rowData)
+                    if rowData and len(row) > 3 * (len(rowData) - 1):
+                        yield row
+
+# docx 파일을 단락 문장과 표로 나누어 파싱하는 함수입니다.
+# {"paragraphs": [문장, ...], "tables": [[[셀, ...], ...], ...]} 를 반환합니다.
+# 표 행을 " | " 로 이어 붙이지 않고 셀 리스트 그대로 보존합니다.
+def parseDocxStructured(filePath):
+    internStrip = _makeInternStrip()
+    paragraphs = []
+    tables = []
+
+    import zipfile
+    with zipfile.ZipFile(filePath) as z, z.open("word/document.xml") as f:
+        for isP, block in iterBlockItems(f):
+            if isP:
+                paragraphs.extend(splitSentences(_elementText(block)))
+            else:
+                # 내용이 있는 행만 남기고, 빈 표는 추가하지 않습니다.
+                rows = [rowData for rowData in _tableRows(block, internStrip) if any(rowData)]
+                if rows:
+                    tables.append(rows)
+
+    return {"paragraphs": paragraphs, "tables": tables}
 
+# 파싱 결과 캐시를 저장할 디렉터리입니다.
+CACHE_DIR = ".cache"
+# 파싱 결과 형식이 바뀌면 올려서 이전 캐시를 무시하게 합니다.
+# (2: 표 셀 단락을 \n 으로 연결, 3: 단락 자신의 런만 읽고 w:br 종류/noBreakHyphen/ptab 반영)
+CACHE_VERSION = 3
+
+# 파일 내용의 해시를 키로 파싱 결과를 캐시하는 함수입니다.
+def _cached_parse(filePath):
+    with open(filePath, "rb") as fileObject:
+        fileHash = hashlib.blake2b(fileObject.read()).hexdigest()[:16]
+
+    # 해시 충돌을 줄이기 위해 파일 이름도 캐시 파일 이름에 포함합니다.
+    cachePath = os.path.join(CACHE_DIR, f"{os.path.basename(filePath)}_{fileHash}.v{CACHE_VERSION}.json")
+    if os.path.exists(cachePath):
+        with open(cachePath, "rb") as fileObject:
+            return _jsonLoads(fileObject.read())
+
+    content = list(parseDocxClean(filePath))
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cachePath, "wb") as fileObject:
+        fileObject.write(_jsonBytes(content))
     return content
 
+# 프로세스 간에 제너레이터를 넘길 수 없으므로 리스트로 파싱하는 함수입니다.
+def _parseDocxList(filePath):
+    return list(parseDocxClean(filePath))
+
+# 여러 docx 파일을 CPU 코어 수만큼 병렬로 파싱하는 함수입니다.
+# {파일 경로: 문장/표 행 리스트} 딕셔너리를 반환합니다.
+def parseDocxCleanBatch(paths, workers=None, useCache=True):
+    from concurrent.futures import ProcessPoolExecutor
+    parse = _cached_parse if useCache else _parseDocxList
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return dict(zip(paths, ex.map(parse, paths)))
+
+# 파싱된 데이터를 한 줄에 하나씩 JSON Lines 파일로 저장하는 함수입니다.
+def writeJsonl(parsedData, outPath):
+    with open(outPath, "wb") as fileObject:
+        for sentence in parsedData:
+            fileObject.write(_jsonBytes(sentence))
+            fileObject.write(b"\n")
+
 # 이 코드가 메인으로 실행될 때만 아래 내용을 실행합니다.
 if __name__ == "__main__":
-    filePath = "테스트.docx"
-    parsedData = parseDocxClean(filePath)
+    import argparse
+    ap = argparse.ArgumentParser(description="docx → JSON Lines(문장/표 행 단위)")
+    ap.add_argument("input", nargs="?", default="테스트.docx", help="입력 파일(.docx) 또는 docx 파일들이 있는 폴더")
+    ap.add_argument("--no-cache", action="store_true", help="캐시를 사용하지 않고 항상 다시 파싱")
+    ap.add_argument("--workers", type=int, default=None, help="폴더 입력 시 병렬 프로세스 수(기본=CPU 코어 수)")
+    ap.add_argument("--structured", action="store_true", help="단락 문장과 표(셀 리스트)를 나눈 JSON 으로 저장")
+    args = ap.parse_args()
 
-    # 파싱된 데이터를 JSON 파일로 저장합니다.
-    with open("parsed_result1.json", "w", encoding="utf-8") as fileObject:
-        json.dump(parsedData, fileObject, ensure_ascii=False, indent=2)
+    filePath = args.input
+    if args.structured:
+        # 단락/표를 나눈 구조를 하나의 JSON 파일로 저장합니다.
+        with open("parsed_result1.json", "wb") as fileObject:
+            fileObject.write(_jsonBytes(parseDocxStructured(filePath)))
+        print("✅ 단락/표 구조 JSON 생성 완료 → parsed_result1.json")
+    elif os.path.isdir(filePath):
+        # 폴더 안의 모든 docx 를 병렬로 파싱하고, 파일마다 <이름>.jsonl 로 저장합니다.
+        paths = sorted(os.path.join(filePath, n) for n in os.listdir(filePath) if n.lower().endswith(".docx"))
+        results = parseDocxCleanBatch(paths, workers=args.workers, useCache=not args.no_cache)
+        for path, parsedData in results.items():
+            outPath = os.path.splitext(os.path.basename(path))[0] + ".jsonl"
+            writeJsonl(parsedData, outPath)
+            print(f"✅ 문장/줄 단위 JSON Lines 생성 완료 → {outPath}")
+    else:
+        parsedData = parseDocxClean(filePath) if args.no_cache else _cached_parse(filePath)
+        writeJsonl(parsedData, "parsed_result1.jsonl")
 
-    # 완료 메시지를 출력합니다.
-    print("✅ 문장/줄 단위 JSON 생성 완료 → parsed_result1.json")
+        # 완료 메시지를 출력합니다.
+        print("✅ 문장/줄 단위 JSON Lines 생성 완료 → parsed_result1.jsonl")
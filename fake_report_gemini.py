@@ -16,41 +16,77 @@ generate_reports_fake_kr_dynamic.py
   pip install faker python-dateutil tqdm
 """
 
-import re, os, json, time, argparse, unicodedata, random
+import re, os, json, time, argparse, unicodedata, random, hashlib
+from functools import lru_cache
 from pathlib import Path
 from zipfile import ZipFile, ZIP_DEFLATED
-from glob import glob
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from types import SimpleNamespace
 from faker import Faker
+try:
+    import orjson   # 있으면 JSONL 로그 직렬화에 사용 (UTF-8 bytes 를 바로 돌려줌)
+    _json_bytes = orjson.dumps
+except ImportError:
+    _json_bytes = lambda o: json.dumps(o, ensure_ascii=False).encode("utf-8")
+try:
+    import re2 as _rx   # 선형 시간 RE2 엔진 (있으면 토큰 추출에 사용)
+except ImportError:
+    _rx = re
 
 # ---------------- Basics ----------------
 FAKER_LOCALE = "ko_KR"
-fake = Faker(FAKER_LOCALE)
-NOISE = r"(?:\s|<[^>]+?>|[\u200B\uFEFF\u00A0]|&nbsp;)*"
-TOKEN_PLAIN_RE = re.compile(r"([\{\｛]{2}.*?[\}\｝]{2})", re.DOTALL)
-TOKEN_FAST_RE  = re.compile(r"{{\s*([A-Za-z0-9\u3131-\u318E\uAC00-\uD7A3_ /()\-\.%:,'\"]+?)\s*}}")
 
+# Faker 로케일 초기화는 비싸므로 실제로 값을 뽑을 때 프로세스당 한 번만
+@lru_cache(maxsize=None)
+def _faker()->Faker:
+    return Faker(FAKER_LOCALE)
+
+# 토큰 추출: 앞쪽 분기(ASCII {{ 토큰명 }})가 맞으면 group(1)에 토큰명, 아니면 뒤쪽 일반 분기.
+# 두 분기는 같은 위치에서 같은 구간에 걸리므로 XML 을 한 번만 훑으면 됨.
+# 게으른 .*? 대신 괄호 제외 문자 클래스 → 백트래킹 없이 선형 스캔
+# RE2 는 \uXXXX 이스케이프와 비 ASCII 문자 앞의 \ 를 받지 않음 → 한글 범위/전각 괄호는 문자 그대로
+_TOKEN_PAT = (r"\{\{\s*([A-Za-z0-9" "\u3131-\u318E\uAC00-\uD7A3" r"_ /()\-.%:,'\"]+)\s*\}\}"
+              r"|[{｛]{2}[^{}｛｝]*[}｝]{2}")
+try:
+    TOKEN_RE = _rx.compile(_TOKEN_PAT)
+except Exception:
+    TOKEN_RE = re.compile(_TOKEN_PAT)
+# {{…}} / ｛｛…｝｝ 구간 (안쪽에 또 다른 여는 괄호가 없는 가장 짧은 구간)
+_SPAN_RE = re.compile(r"(?:\{\{|\｛\｛)((?:(?!\{\{|\｛\｛).)*?)(?:\}\}|\｝\｝)", re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+?>", re.DOTALL)
+_ZW_DROP = str.maketrans("", "", "\u200B\uFEFF")
+_FW_OPEN = "｛｛".encode("utf-8")
+_XML_ESCAPE = str.maketrans({"&":"&amp;", "<":"&lt;", ">":"&gt;", '"':"&quot;"})
+
+# 같은 토큰/키 문자열이 보고서마다 반복되므로 정규화 결과를 메모
+@lru_cache(maxsize=8192)
 def nfc(s:str)->str:
-    return unicodedata.normalize("NFC", s)
+    # 템플릿 텍스트는 대부분 이미 NFC → 검사만 하고 그대로 반환
+    return s if unicodedata.is_normalized("NFC", s) else unicodedata.normalize("NFC", s)
 
 def clean_token_text(s:str)->str:
-    s = re.sub(r"<[^>]+?>","", s, flags=re.DOTALL)
+    s = _TAG_RE.sub("", s)
     s = s.replace("\u200B","").replace("\uFEFF","").replace("\u00A0"," ")
     s = re.sub(r"\s+"," ", s)
     return nfc(s.strip())
 
 def extract_tokens_from_xml_text(xml:str):
     out=set()
-    for m in TOKEN_FAST_RE.finditer(xml):
-        out.add(nfc(m.group(1).strip()))
-    for m in TOKEN_PLAIN_RE.finditer(xml):
-        inner=re.sub(r"^[\{\｛]{2}","",m.group(1))
-        inner=re.sub(r"[\}\｝]{2}$","",inner)
-        inner=clean_token_text(inner)
+    for m in TOKEN_RE.finditer(xml):
+        fast=m.group(1)
+        if fast: out.add(nfc(fast.strip()))
+        inner=clean_token_text(m.group(0)[2:-2])
         if inner: out.add(inner)
     return sorted(out)
 
 def extract_tokens_from_hwpx(path:Path):
+    # 템플릿이 바뀌지 않았으면(경로+mtime 동일) 이전 추출 결과 재사용
+    path=Path(path)
+    return list(_extract_tokens_cached(str(path), path.stat().st_mtime_ns))
+
+@lru_cache(maxsize=8)
+def _extract_tokens_cached(path:str, mtime_ns:int):
     found=set()
     with ZipFile(path,"r") as zin:
         for name in zin.namelist():
@@ -59,35 +95,62 @@ def extract_tokens_from_hwpx(path:Path):
                 xml=zin.read(name).decode("utf-8",errors="ignore")
             except:
                 continue
-            found |= set(extract_tokens_from_xml_text(xml))
-    return sorted(found)
+            found.update(extract_tokens_from_xml_text(xml))
+    return tuple(sorted(found))
+
+CACHE_DIR = ".cache"
+# 토큰 추출 결과가 달라지면 올려서 이전 캐시 무시 (2: RE2 호환 TOKEN_RE)
+TOKENS_CACHE_VERSION = 2
+
+def cached_tokens(path:Path)->list:
+    """템플릿 토큰을 .cache/ 에 저장해 두고 다음 실행부터 재사용 (경로+mtime+크기가 같을 때만)"""
+    path=Path(path); st=path.stat()
+    key=hashlib.blake2b(f"{path.resolve()}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8")).hexdigest()[:16]
+    cache_path=Path(CACHE_DIR) / f"{path.name}_{key}.v{TOKENS_CACHE_VERSION}.tokens.json"
+    if cache_path.exists():
+        return json.loads(cache_path.read_bytes())
+    tokens=extract_tokens_from_hwpx(path)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_path.write_bytes(_json_bytes(tokens))
+    return tokens
+
+@lru_cache(maxsize=8192)
+def _span_key(inner:str)->str:
+    """{{ }} 안쪽 문자열 → 조회 키 (태그/공백/제로폭/&nbsp; 제거 + NFC + 소문자)"""
+    if "<" in inner: inner = _TAG_RE.sub("", inner)
+    if "&" in inner: inner = inner.replace("&nbsp;", "")
+    return nfc("".join(inner.translate(_ZW_DROP).split())).lower()
 
-def build_split_tolerant_pattern(token:str)->re.Pattern:
-    open_pat  = r"(?:\{\{|\｛\｛)"
-    close_pat = r"(?:\}\}|\｝\｝)"
-    parts = [re.escape(ch) for ch in token]
-    mid   = NOISE.join(parts)
-    full  = rf"{open_pat}{NOISE}{mid}{NOISE}{close_pat}"
-    return re.compile(full, flags=re.IGNORECASE|re.DOTALL)
+@lru_cache(maxsize=4)
+def _load_template(path:str, mtime_ns:int):
+    """템플릿 멤버를 프로세스당 한 번만 읽어 둠 → [(이름, bytes, 토큰 치환 필요 여부)]"""
+    members=[]
+    with ZipFile(path,"r") as zin:
+        for info in zin.infolist():
+            name=info.filename; data=zin.read(info)
+            # XML 이면서 토큰 여는 괄호({{ / ｛｛)가 있는 멤버만 치환 대상
+            has_tokens = name.lower().endswith(".xml") and (b"{{" in data or _FW_OPEN in data)
+            members.append((name, data, has_tokens))
+    return tuple(members)
 
 def replace_tokens_in_hwpx(template_hwpx:Path, out_hwpx:Path, mapping:dict):
-    compiled = {nfc(k): build_split_tolerant_pattern(nfc(k)) for k in mapping}
-    with ZipFile(template_hwpx,"r") as zin, ZipFile(out_hwpx,"w",compression=ZIP_DEFLATED) as zout:
-        for name in zin.namelist():
-            data=zin.read(name)
-            if name.lower().endswith(".xml"):
-                try: s=data.decode("utf-8",errors="ignore")
-                except: zout.writestr(name,data); continue
-                for key,pat in compiled.items():
-                    val = mapping[key]
-                    val = (val.replace("&","&amp;")
-                               .replace("<","&lt;")
-                               .replace(">","&gt;")
-                               .replace('"',"&quot;"))
-                    s = pat.sub(val, s)
-                zout.writestr(name, s.encode("utf-8"))
-            else:
-                zout.writestr(name, data)
+    # 토큰마다 정규식을 돌리지 않고, {{…}} 구간을 한 번에 찾은 뒤
+    # 안쪽의 태그/공백을 지운 키로 dict 조회 (XML 멤버당 1회 스캔)
+    # XML 이스케이프는 출력 파일당 값마다 한 번만
+    lookup = {}
+    for k,v in mapping.items():
+        lookup.setdefault(_span_key(nfc(k)), v.translate(_XML_ESCAPE))
+    span_sub = lambda m: lookup.get(_span_key(m.group(1)), m.group(0))
+    # 템플릿 zip 은 보고서마다 다시 열지 않고 메모리에 올려 둔 멤버를 재사용
+    template_hwpx=Path(template_hwpx)
+    members=_load_template(str(template_hwpx), template_hwpx.stat().st_mtime_ns)
+    # 생성물은 압축률보다 속도가 중요 → deflate 레벨 1 (기본 6 대비 크기 차이는 작음)
+    with ZipFile(out_hwpx,"w",compression=ZIP_DEFLATED,compresslevel=1) as zout:
+        for name, data, has_tokens in members:
+            if has_tokens:
+                s = _SPAN_RE.sub(span_sub, data.decode("utf-8",errors="ignore"))
+                data = s.encode("utf-8")
+            zout.writestr(name, data)
 
 # ---------------- Industry Profiles ----------------
 # 각 업종마다 "제품/고객/성장률/마진/CapEx/규제" 범위를 정의
@@ -210,6 +273,9 @@ INDUSTRY_PROFILES = {
                rev_cagr=(10,30), opm=(5,15), ebitda=(8,18), capex_intensity=(2,6),
                reg="특금법/가상자산", price_mult=(1.5,5.0), ev_ebitda=(7,14)),
 }
+# gen_context 마다 키 목록을 다시 만들지 않도록 모듈 로드 시 한 번만
+_INDUSTRY_KEYS = tuple(INDUSTRY_PROFILES)
+_COMP_RISKS = ("원자재 가격 변동","규제 강화","고객 집중","신규 진입자")
 
 COMPANY_SCALES = [
     ("스타트업","Seed",          (5, 20)),   # (연매출 억원 범위) 기준선
@@ -244,20 +310,16 @@ SUF = ["테크","랩스","로보틱스","바이오","에너지","시스템즈","
        "네트웍스","인베스트먼트","프라임","파트너스","클라우드","의료","스마트","팩토리","헬스","푸드","식품","교육","관광","리테일","게임즈","에너지"]
 FORM = ["주식회사","㈜","(유)"]
 
-# 인덱스 추적용
-_company_index = 0
-
-def company_name():
-    global _company_index
-    if _company_index < len(PREDEFINED_COMPANIES):
-        # 제공된 목록에서 순서대로 반환
-        raw_name = PREDEFINED_COMPANIES[_company_index]
-        _company_index += 1
+def company_name(index=None):
+    # 보고서 번호(index)가 주어지면 제공된 목록에서 그 순서의 회사명을 반환
+    # (모듈 전역 카운터를 쓰지 않으므로 병렬 워커에서도 보고서마다 같은 이름)
+    if index is not None and index < len(PREDEFINED_COMPANIES):
+        raw_name = PREDEFINED_COMPANIES[index]
         # 괄호 앞부분만 추출
         clean_name = raw_name.split("(")[0]
         return clean_name
     else:
-        # 이후부터는 랜덤 생성
+        # 그 외에는 (시드가 고정된) 랜덤 생성
         pre = random.choice(PRE)
         suf = random.choice(SUF)
         form = random.choice(FORM)
@@ -265,10 +327,10 @@ def company_name():
 
 
 def person(role=None):
-    return f"{fake.name()}" + (f" ({role})" if role else "")
+    return f"{_faker().name()}" + (f" ({role})" if role else "")
 
 def address():
-    return fake.address().replace("\n"," ")
+    return _faker().address().replace("\n"," ")
 
 def yr():
     return random.randint(2018, 2032)
@@ -285,11 +347,12 @@ def money_억(a,b,step=1,decimals=False):
 def choice_sent(cands): return random.choice(cands)
 
 # ---------------- Company Context (industry-aware) ----------------
-def gen_context():
-    sector = random.choice(list(INDUSTRY_PROFILES.keys()))
+def gen_context(company_index=None):
+    uniform = random.uniform
+    sector = random.choice(_INDUSTRY_KEYS)
     prof = INDUSTRY_PROFILES[sector]
     scale, stage, rev_base = random.choice(COMPANY_SCALES)
-    name = company_name()
+    name = company_name(company_index)
     # 재무 사이즈 기준선
     base_rev = random.randint(rev_base[0], rev_base[1])
     years = 5
@@ -297,33 +360,38 @@ def gen_context():
     series_years = [now_year - (years - i) for i in range(1, years+1)]  # e.g., 2020..2024
     low_cagr, high_cagr = prof["rev_cagr"]
     cagr = pct(low_cagr, high_cagr, 1)
+    growth = 1 + cagr/100.0
     revs = [base_rev]
+    r = base_rev
     for _ in range(1, years):
-        revs.append(int(revs[-1] * (1 + cagr/100.0) + random.uniform(-0.03,0.03)*revs[-1]))
+        r = int(r * growth + uniform(-0.03,0.03)*r)
+        revs.append(r)
     # 마진/현금흐름
     opm_start, opm_end = prof["opm"]
     opm_s = pct(opm_start, min(opm_start+5, opm_end), 1)
     opm_e = pct(max(opm_start, opm_end-5), opm_end, 1)
-    op_profits = [round(revs[i]* (opm_s + (opm_e-opm_s)*i/(years-1))/100,1) for i in range(years)]
+    op_profits = [round(r* (opm_s + (opm_e-opm_s)*i/(years-1))/100,1) for i, r in enumerate(revs)]
     ebitda_m = pct(prof["ebitda"][0], prof["ebitda"][1],1)
-    ebitdas = [round(revs[i]*ebitda_m/100,1) for i in range(years)]
-    net_m = max(1.0, opm_s-1.5)
-    net_profits = [round(revs[i]* (net_m/100),1) for i in range(years)]
+    ebitdas = [round(r*ebitda_m/100,1) for r in revs]
+    net_ratio = max(1.0, opm_s-1.5)/100
+    net_profits = [round(r*net_ratio,1) for r in revs]
     # BS 대략 일관
-    assets = [int(revs[i]*random.uniform(1.2,1.8)) for i in range(years)]
-    debt_ratio = [pct(60, 140, 0) if scale!="대기업" else pct(30,90,0) for _ in range(years)]
-    liabs = [int(assets[i]* (debt_ratio[i]/100)) for i in range(years)]
-    equity = [assets[i]-liabs[i] for i in range(years)]
-    cur_ratio = [pct(120, 180, 0) if scale!="스타트업" else pct(100,150,0) for _ in range(years)]
+    assets = [int(r*uniform(1.2,1.8)) for r in revs]
+    dr_lo, dr_hi = (60, 140) if scale!="대기업" else (30, 90)
+    debt_ratio = [pct(dr_lo, dr_hi, 0) for _ in range(years)]
+    liabs = [int(a*(d/100)) for a, d in zip(assets, debt_ratio)]
+    equity = [a-l for a, l in zip(assets, liabs)]
+    cr_lo, cr_hi = (120, 180) if scale!="스타트업" else (100, 150)
+    cur_ratio = [pct(cr_lo, cr_hi, 0) for _ in range(years)]
     # 현금흐름: 영업CF ~ EBITDA의 40~80%, 투자CF ~ -CapEx, 재무CF 보정
     capex_int = pct(prof["capex_intensity"][0], prof["capex_intensity"][1], 0) # 매출 대비 %
-    oper_cf = [int(ebitdas[i]*random.uniform(0.4,0.8)) for i in range(years)]
-    invest_cf = [ -int(revs[i]* capex_int/100 * random.uniform(0.6,1.2)) for i in range(years)]
-    fin_cf = [int((op_profits[i]-abs(invest_cf[i]))*random.uniform(0.3,0.9)) for i in range(years)]
+    oper_cf = [int(e*uniform(0.4,0.8)) for e in ebitdas]
+    invest_cf = [ -int(r* capex_int/100 * uniform(0.6,1.2)) for r in revs]
+    fin_cf = [int((o-abs(v))*uniform(0.3,0.9)) for o, v in zip(op_profits, invest_cf)]
     cash_end = []
-    cash = int(base_rev*random.uniform(0.02,0.08))
-    for i in range(years):
-        cash = max(1, cash + oper_cf[i] + invest_cf[i] + fin_cf[i])
+    cash = int(base_rev*uniform(0.02,0.08))
+    for o, v, f in zip(oper_cf, invest_cf, fin_cf):
+        cash = max(1, cash + o + v + f)
         cash_end.append(cash)
 
     # 경쟁사 3개 생성
@@ -334,12 +402,12 @@ def gen_context():
         c_share = round(random.uniform(0.5, 20.0), 1)
         c_tech = random.choice(prof["products"])
         c_clients = random.choice(prof["customers"])
-        c_risk = random.choice(["원자재 가격 변동","규제 강화","고객 집중","신규 진입자"])
+        c_risk = random.choice(_COMP_RISKS)
         comps.append(dict(name=cname, rev=c_rev, share=c_share, tech=c_tech, clients=c_clients, risk=c_risk))
 
     # Valuation 상식적 범위
-    ev_rev = round(random.uniform(INDUSTRY_PROFILES[sector]["price_mult"][0], INDUSTRY_PROFILES[sector]["price_mult"][1]),1)
-    ev_ebitda = round(random.uniform(INDUSTRY_PROFILES[sector]["ev_ebitda"][0], INDUSTRY_PROFILES[sector]["ev_ebitda"][1]),1)
+    ev_rev = round(random.uniform(*prof["price_mult"]),1)
+    ev_ebitda = round(random.uniform(*prof["ev_ebitda"]),1)
     ev = int(revs[-1]*ev_rev)
     eq = int(ev * random.uniform(0.85, 0.95))
     pps = f"{int(random.uniform(5000, 50000))}원"
@@ -393,480 +461,519 @@ def phrase(obj, ctx):
     return ""
 
 # ---------------- Token mapping (rule-based + fallback) ----------------
+@lru_cache(maxsize=8192)
 def normalize_key(t:str)->str:
     return nfc(t).strip().lower().replace(" ","_")
 
 def klist(nmin=2,nmax=5, item="회사"):
     if "회사" in item:
         return ", ".join(company_name().replace("주식회사 ","") for _ in range(random.randint(nmin,nmax)))
-    return ", ".join(fake.word() for _ in range(random.randint(nmin,nmax)))
+    fk = _faker()
+    return ", ".join(fk.word() for _ in range(random.randint(nmin,nmax)))
 
 def money_from_rev(rev, ratio_lo=0.02, ratio_hi=0.12):
     return f"{int(rev*random.uniform(ratio_lo, ratio_hi))}억 원"
 
+def _role_person(ctx:dict, role:str)->str:
+    """같은 보고서 안의 같은 직책은 같은 인물 (board_cfo/cfo_name 등, Faker 호출도 한 번)"""
+    people = ctx.setdefault("_people", {})
+    if role not in people: people[role] = person(role)
+    return people[role]
+
+def _tail5(seq:list, n:int, d1:str, d2:str)->tuple:
+    """최근 5개년 값 → 문자열 5개 (연도 수가 모자라면 앞 두 칸은 기본값)"""
+    return (str(seq[-5]) if n>=5 else d1, str(seq[-4]) if n>=4 else d2, str(seq[-3]), str(seq[-2]), str(seq[-1]))
+
+def _known_view(ctx:dict):
+    """_HANDLERS 가 공통으로 쓰는 파생 값 (ctx 당 한 번만 계산해 ctx 에 보관)"""
+    v = ctx.get("_kv")
+    if v is not None: return v
+    years = ctx["years"]; revs=ctx["revs"]
+    y1, y3 = years[-3], years[-1]
+    r1, r2, r3 = revs[-3:]; o1, o2, o3 = ctx["op"][-3:]; n1, n2, n3 = ctx["net"][-3:]
+    a1, a2, a3 = ctx["assets"][-3:]; l1, l2, l3 = ctx["liabs"][-3:]; e1, e2, e3 = ctx["equity"][-3:]
+    dr1, dr2, dr3 = ctx["debt_ratio"][-3:]; cr1, cr2, cr3 = ctx["cur_ratio"][-3:]
+    c0, c1, c2 = ctx["comps"]
+    prof=ctx["prof"]
+    v = ctx["_kv"] = SimpleNamespace(
+        years=years, revs=revs, y1=y1, y3=y3, sy1=str(y1), sy2=str(years[-2]), sy3=str(y3),
+        y_start=str(years[-5]) if len(years)>=5 else str(years[0]), n_period=str(len(years)-1),
+        r1=r1, r2=r2, r3=r3, o1=o1, o2=o2, o3=o3, n1=n1, n2=n2, n3=n3,
+        a1=a1, a2=a2, a3=a3, l1=l1, l2=l2, l3=l3, e1=e1, e2=e2, e3=e3,
+        dr1=dr1, dr2=dr2, dr3=dr3, cr1=cr1, cr2=cr2, cr3=cr3, c0=c0, c1=c1, c2=c2,
+        prof=prof, prods=prof["products"],
+        oper_cf=ctx["oper_cf"], invest_cf=ctx["invest_cf"], fin_cf=ctx["fin_cf"],
+        oper_cf5=_tail5(ctx["oper_cf"], len(years), "1", "2"), invest_cf5=_tail5(ctx["invest_cf"], len(years), "-5", "-4"),
+        fin_cf5=_tail5(ctx["fin_cf"], len(years), "3", "4"), cash5=_tail5(ctx["cash"], len(years), "5", "6"),
+        ev=ctx["ev"], ev_ebitda=ctx["ev_ebitda"], ev_rev=ctx["ev_rev"], cagr=ctx["cagr"], ebitda_m=ctx["ebitda_m"],
+        now=datetime.now(),
+    )
+    return v
+
+# 토큰 키 → 값 생성기(또는 고정 문자열). 요청된 토큰의 값만 그때그때 계산
+# (예전처럼 토큰마다 ~300개 항목 dict 전체를 만들지 않음)
+_HANDLERS = {
+    # --- 회사/기본 ---
+    "target_company": lambda ctx, v: ctx["name"],
+    "company_name": lambda ctx, v: ctx["name"],
+    "registration_no": lambda ctx, v: f"{random.randint(100,999)}-{random.randint(10,99)}-{random.randint(10000,99999)}",
+    "registration_number": lambda ctx, v: f"{random.randint(100,999)}-{random.randint(10,99)}-{random.randint(10000,99999)}",
+    "report_date": lambda ctx, v: f"{v.now.year}. {v.now.month:02d}. {v.now.day:02d}",
+    "hq_address": lambda ctx, v: address(),
+    "hq_description": lambda ctx, v: phrase("hq_desc", ctx),
+    "hq_desc": lambda ctx, v: phrase("hq_desc", ctx),
+    "business_sector": lambda ctx, v: ctx["sector"],
+    "business_products": lambda ctx, v: ", ".join(v.prods),
+    "shareholders": f"최대주주 및 특수관계인, 전략투자자, 임직원·소액주주로 구성",
+    "major_shareholders": lambda ctx, v: f"{person()} 외 {random.randint(1,3)}인",
+    "major_share_ratio": lambda ctx, v: f"{pct(25,60,1)}%",
+    "affiliate_company": lambda ctx, v: company_name(),
+    "affiliate_ratio": lambda ctx, v: f"{pct(10,45,1)}%",
+    "minority_shareholders": "임직원·소액주주",
+    "clients": lambda ctx, v: klist(item="회사"),
+    "products": lambda ctx, v: ", ".join(v.prods[:min(3,len(v.prods))]),
+    "financials": lambda ctx, v: f"{v.y3}년 매출 {v.r3}억 원, 영업이익 {v.o3}억 원, 임직원 {random.randint(20,2000)}명",
+    # --- 목적/배경/포인트 ---
+    "strategic_objectives": lambda ctx, v: phrase("purpose_strategic", ctx),
+    "financial_objectives": lambda ctx, v: phrase("purpose_financial", ctx),
+    "policy_environment": lambda ctx, v: f"{v.prof['reg']} 관련 정책 변화 모니터링 필요",
+    "tech_competitiveness": lambda ctx, v: choice_sent([
+        "핵심 기술 내재화 및 특허 포트폴리오 보유",
+        "제품 신뢰성·효율 개선에 따른 TCO 강점",
+        "고부가가치 제품 믹스 전환 진행"
+    ]),
+    "growth_potential": lambda ctx, v: choice_sent([
+        f"핵심 고객군 확대 및 {ctx['sector']} 수요 성장",
+        f"해외 시장 진출 가속 및 파트너십 확대",
+        "제품 라인업 확장과 단가 개선 여지"
+    ]),
+    "hr_advantage": lambda ctx, v: choice_sent([
+        "핵심 연구인력 다수 보유, 이직률 낮음",
+        "산업 도메인 전문가 중심의 조직",
+        "내부 교육·채용 파이프라인 확보"
+    ]),
+    "market_position": lambda ctx, v: phrase("market_pos", ctx),
+    # --- 리스크 요약 ---
+    "risk_financial": lambda ctx, v: phrase("risk_fin", ctx),
+    "risk_business": lambda ctx, v: phrase("risk_biz", ctx),
+    "risk_tech": lambda ctx, v: phrase("risk_tech", ctx),
+    "risk_operational": lambda ctx, v: phrase("risk_op", ctx),
+    "sensitive_risks": lambda ctx, v: phrase("sensitive", ctx),
+    # --- 투자 구조/조건 ---
+    "investment_structure": lambda ctx, v: random.choice(["Equity","Convertible","Mezzanine","혼합(신주+구주)"]),
+    "investment_amount": lambda ctx, v: money_from_rev(v.r3, 0.15, 0.6),
+    "investment_preference_terms": "우선주 배당/청산우선권·보호조항 등 투자자 권리 확보",
+    "drag_tag_rights": "동반매도·매수권 반영(주요 거래 시 의무 적용)",
+    "governance_participation": "이사회 1석·중요안건 동의권",
+    "additional_conditions": "기술·법무·세무 DD 완료 후 집행",
+    # --- Exit ---
+    "exit_ipo_domestic": lambda ctx, v: random.choice(["KOSDAQ","KOSPI"])+" 상장 추진",
+    "exit_mna_strategic": "전략적 투자자 대상 매각 가능성",
+    "exit_secondary": "재무적 투자자 대상 블록딜",
+    "exit_share_buyback": "현금흐름 호전 시 자사주 매입",
+    "exit_risk": "시장 침체/규제 변수로 일정 지연 가능",
+    # --- 타임라인 ---
+    "deal_review_start": "내부 투자심의 승인 후 비공개 검토 시작",
+    "deal_review_date": lambda ctx, v: f"{v.now.year}년 {random.randint(1,12)}월",
+    "due_diligence": "재무·세무·법무·기술 전 영역 실사",
+    "due_diligence_date": lambda ctx, v: f"{v.now.year}년 {random.randint(1,12)}월",
+    "contract_negotiation": "밸류·우선주 구조·보호조항 협상",
+    "contract_negotiation_date": lambda ctx, v: f"{v.now.year+1}년 {random.randint(1,12)}월",
+    "contract_signing": "SHA/SPA 체결",
+    "contract_signing_date": lambda ctx, v: f"{v.now.year+1}년 {random.randint(1,12)}월",
+    "capital_injection_and_transfer": "납입 및 지분 이전",
+    "capital_injection_date": lambda ctx, v: f"{v.now.year+1}년 {random.randint(1,12)}월",
+    "post_management_date": lambda ctx, v: f"{v.now.year+1}년 {random.randint(1,12)}월 이후 정기 모니터링",
+    # --- 회사 연혁/지배구조 ---
+    "company_foundation": lambda ctx, v: f"{random.randint(1995,2023)}년 설립 → 법인 전환 {random.randint(2000,2024)}년",
+    "company_growth_stage": lambda ctx, v: choice_sent(["창업기","성장기","확장기","성숙기"]),
+    "company_milestones": "핵심 제품 상용화·주요 고객사 확보·해외 파트너십",
+    "company_diversification": "주요 시장 외 인접 영역 확장",
+    "company_current_status": "R&D·생산·영업 조직 균형적 운영",
+    "board_composition": "이사회 5인(사내 2, 사외 3), 감사 1",
+    "board_ceo": lambda ctx, v: _role_person(ctx, "CEO"),
+    "board_cfo": lambda ctx, v: _role_person(ctx, "CFO"),
+    "board_cto": lambda ctx, v: _role_person(ctx, "CTO"),
+    "board_others": lambda ctx, v: person("사외이사"),
+    "governance_structure": "오너 중심이나 외부 이사 견제 장치 보유",
+    # --- BM/수익 ---
+    "revenue_model": lambda ctx, v: choice_sent(["구독+라이선스+서비스","제품판매+유지보수","프로젝트+소모품"]),
+    "revenue_b2g": lambda ctx, v: money_from_rev(v.r3,0.1,0.6),
+    "revenue_b2b": lambda ctx, v: money_from_rev(v.r3,0.2,0.7),
+    "revenue_b2c": lambda ctx, v: money_from_rev(v.r3,0.0,0.4),
+    "revenue_service": lambda ctx, v: money_from_rev(v.r3,0.05,0.3),
+    "b2g_share": lambda ctx, v: f"{pct(0,60,1)}%",
+    "b2b_share": lambda ctx, v: f"{pct(10,80,1)}%",
+    "b2c_share": lambda ctx, v: f"{pct(0,40,1)}%",
+    "service_share": lambda ctx, v: f"{pct(5,40,1)}%",
+    "key_revenue_sources": lambda ctx, v: ", ".join(v.prods),
+    "business_strategy": lambda ctx, v: choice_sent(["고마진 제품 믹스 확대","전략 고객 장기계약","해외 파트너 채널 구축"]),
+    # --- 제품/서비스 ---
+    "product_service_a": lambda ctx, v: v.prods[0],
+    "product_service_b": lambda ctx, v: v.prods[1] if len(v.prods)>1 else "신규 라인업",
+    "product_service_c": lambda ctx, v: v.prods[2] if len(v.prods)>2 else "서비스 패키지",
+    "product_service_d": "유지보수/운영 서비스",
+    # --- 시장/경쟁 ---
+    "total_addressable_market": lambda ctx, v: money_억( int(v.r3*20), int(v.r3*300), 10),
+    "serviceable_available_market": lambda ctx, v: money_억( int(v.r3*8), int(v.r3*150), 5),
+    "serviceable_obtainable_market": lambda ctx, v: money_억( int(v.r3*3), int(v.r3*60), 5),
+    "target_customer_segments": lambda ctx, v: ", ".join(v.prof["customers"]),
+    "additional_market_info": lambda ctx, v: phrase("market_pos", ctx),
+    "competitor_a_name": lambda ctx, v: v.c0["name"], "competitor_b_name": lambda ctx, v: v.c1["name"], "competitor_c_name": lambda ctx, v: v.c2["name"],
+    "competitor_a_profile": lambda ctx, v: f"{ctx['sector']} 주력, 고객 {v.c0['clients']}",
+    "competitor_b_profile": lambda ctx, v: f"{ctx['sector']} 확대 중, 고객 {v.c1['clients']}",
+    "competitor_c_profile": lambda ctx, v: f"틈새 강점, 기술 {v.c2['tech']}",
+    "competitor_a_internal_note": "제품 라인 안정적이나 혁신 속도 제한",
+    "competitor_b_eval_note": "수익성 저하·납기 이슈로 감점",
+    "competitor_c_tech_note": "기술 우수하나 영업 네트워크 약함",
+    "competitor_a_revenue": lambda ctx, v: f"{v.c0['rev']}억원",
+    "competitor_b_revenue": lambda ctx, v: f"{v.c1['rev']}억원",
+    "competitor_c_revenue": lambda ctx, v: f"{v.c2['rev']}억원",
+    "competitor_a_share": lambda ctx, v: f"{v.c0['share']}%",
+    "competitor_b_share": lambda ctx, v: f"{v.c1['share']}%",
+    "competitor_c_share": lambda ctx, v: f"{v.c2['share']}%",
+    "target_revenue": lambda ctx, v: f"{v.r3}억원",
+    "competitor_a_clients": lambda ctx, v: v.c0["clients"], "competitor_b_clients": lambda ctx, v: v.c1["clients"], "competitor_c_clients": lambda ctx, v: v.c2["clients"], "target_clients": lambda ctx, v: random.choice(v.prof["customers"]),
+    "competitor_a_tech": lambda ctx, v: v.c0["tech"], "competitor_b_tech": lambda ctx, v: v.c1["tech"], "competitor_c_tech": lambda ctx, v: v.c2["tech"], "target_tech": lambda ctx, v: random.choice(v.prods),
+    "competitor_a_risk": lambda ctx, v: v.c0["risk"], "competitor_b_risk": lambda ctx, v: v.c1["risk"], "competitor_c_risk": lambda ctx, v: v.c2["risk"], "target_risk": "원가/환율/규제",
+    "additional_competitor_info": "신규 진입자·대체재 동향 주기적 점검",
+    # --- 규제 ---
+    "regulatory_environment_current": lambda ctx, v: f"{v.prof['reg']} 규제·인증 요건 존재",
+    "policy_changes_future": "지원정책/규제완화·강화 불확실성",
+    "regulatory_risk_summary": "인증·승인 지연 시 매출 인식 지체 가능",
+    # --- P/L 표 ---
+    "year_1": lambda ctx, v: v.sy1, "year_2": lambda ctx, v: v.sy2, "year_3": lambda ctx, v: v.sy3,
+    "revenue_year1": lambda ctx, v: str(v.r1), "revenue_year2": lambda ctx, v: str(v.r2), "revenue_year3": lambda ctx, v: str(v.r3),
+    "op_profit_year1": lambda ctx, v: str(int(v.o1)), "op_profit_year2": lambda ctx, v: str(int(v.o2)), "op_profit_year3": lambda ctx, v: str(int(v.o3)),
+    "net_profit_year1": lambda ctx, v: str(int(v.n1)), "net_profit_year2": lambda ctx, v: str(int(v.n2)), "net_profit_year3": lambda ctx, v: str(int(v.n3)),
+    "op_margin_year1": lambda ctx, v: f"{round(v.o1/v.r1*100,1)}", "op_margin_year2": lambda ctx, v: f"{round(v.o2/v.r2*100,1)}", "op_margin_year3": lambda ctx, v: f"{round(v.o3/v.r3*100,1)}",
+    "is_revenue": lambda ctx, v: f"{v.y1}~{v.y3} 매출 {v.r1}→{v.r3}억",
+    "is_revenue_trend": lambda ctx, v: f"CAGR {v.cagr}%",
+    "is_op_profit": lambda ctx, v: f"영업이익 {int(v.o1)}→{int(v.o3)}억",
+    "is_op_profit_reason": "제품 믹스 개선·원가 절감",
+    "is_net_profit": lambda ctx, v: f"순이익 {int(v.n1)}→{int(v.n3)}억",
+    "is_net_profit_comment": "판관비 효율화·금융비용 변동",
+    # --- BS 표 ---
+    "balancesheet_year_1": lambda ctx, v: v.sy1,
+    "balancesheet_year_2": lambda ctx, v: v.sy2,
+    "balancesheet_year_3": lambda ctx, v: v.sy3,
+    "balancesheet_totalassets_1": lambda ctx, v: str(v.a1),
+    "balancesheet_totalassets_2": lambda ctx, v: str(v.a2),
+    "balancesheet_totalassets_3": lambda ctx, v: str(v.a3),
+    "balancesheet_totalliabilities_1": lambda ctx, v: str(v.l1),
+    "balancesheet_totalliabilities_2": lambda ctx, v: str(v.l2),
+    "balancesheet_totalliabilities_3": lambda ctx, v: str(v.l3),
+    "balancesheet_equity_1": lambda ctx, v: str(v.e1),
+    "balancesheet_equity_2": lambda ctx, v: str(v.e2),
+    "balancesheet_equity_3": lambda ctx, v: str(v.e3),
+    "balancesheet_debtratio_1": lambda ctx, v: str(int(v.dr1)),
+    "balancesheet_debtratio_2": lambda ctx, v: str(int(v.dr2)),
+    "balancesheet_debtratio_3": lambda ctx, v: str(int(v.dr3)),
+    "balancesheet_currentratio_1": lambda ctx, v: str(int(v.cr1)),
+    "balancesheet_currentratio_2": lambda ctx, v: str(int(v.cr2)),
+    "balancesheet_currentratio_3": lambda ctx, v: str(int(v.cr3)),
+    "fin_performance_keypoint": "수익성 개선·운전자본 효율화 필요",
+    # --- 지표 추이 ---
+    "roe_start_year": lambda ctx, v: v.y_start,
+    "roe_end_year": lambda ctx, v: v.sy3,
+    "roe_start_val": lambda ctx, v: f"{pct(3,10,1)}",
+    "roe_end_val": lambda ctx, v: f"{pct(6,18,1)}",
+    "roe_period": lambda ctx, v: v.n_period,
+    "roe_change": lambda ctx, v: f"{pct(1,6,1)}",
+    "roa_start_year": lambda ctx, v: v.y_start,
+    "roa_end_year": lambda ctx, v: v.sy3,
+    "roa_start_val": lambda ctx, v: f"{pct(1,6,1)}",
+    "roa_end_val": lambda ctx, v: f"{pct(2,10,1)}",
+    "roa_comment": "자산 효율성 점진 개선",
+    "ebitda_start_year": lambda ctx, v: v.y_start,
+    "ebitda_start_val": lambda ctx, v: f"{pct(max(5,v.ebitda_m-5), v.ebitda_m,1)}",
+    "ebitda_end_year": lambda ctx, v: v.sy3,
+    "ebitda_end_val": lambda ctx, v: f"{pct(v.ebitda_m, min(35, v.ebitda_m+6),1)}",
+    "ebitda_comment": "규모의 경제·원가 구조 개선",
+    "debt_ratio_start_year": lambda ctx, v: v.sy1,
+    "debt_ratio_start": lambda ctx, v: f"{int(v.dr1)}",
+    "debt_ratio_end_year": lambda ctx, v: v.sy3,
+    "debt_ratio_end": lambda ctx, v: f"{int(v.dr3)}",
+    "debt_ratio_comment": "리파이낸싱·만기 분산 필요",
+    "liquidity_start_year": lambda ctx, v: v.sy1,
+    "liquidity_start": lambda ctx, v: f"{int(v.cr1)}",
+    "liquidity_end_year": lambda ctx, v: v.sy3,
+    "liquidity_end": lambda ctx, v: f"{int(v.cr3)}",
+    "liquidity_comment": "운전자본 관리 강화",
+    "debt_dep_start": lambda ctx, v: f"{pct(15,40,1)}",
+    "debt_dep_end": lambda ctx, v: f"{pct(15,45,1)}",
+    "debt_dep_comment": "차입 의존도 관리 필요",
+    "sales_period": lambda ctx, v: v.n_period,
+    "sales_cagr": lambda ctx, v: f"{v.cagr}",
+    "op_profit_period": lambda ctx, v: v.n_period,
+    "op_profit_cagr": lambda ctx, v: f"{pct(max(3,v.cagr-3), v.cagr+3,1)}",
+    "years": lambda ctx, v: v.n_period,
+    "project_effect": "신규 프로젝트 반영 효과",
+    "target_roe_year": lambda ctx, v: str(yr()),
+    "target_roe": lambda ctx, v: f"{pct(10,20,1)}",
+    "risk_scenario": "수주 지연·환율 급등",
+    "low_case_roe": lambda ctx, v: f"{pct(3,8,1)}",
+    "target_irr": lambda ctx, v: f"{pct(12,25,1)}",
+    "actual_irr": lambda ctx, v: f"{pct(6,18,1)}",
+    "impact_comment": "원가·환율 민감도 영향",
+    "special_quarter": lambda ctx, v: f"{v.y3}년 {random.randint(1,4)}분기",
+    "special_sales": lambda ctx, v: f"{random.randint(5,50)}",
+    "oneoff_project": "일회성 대형 주문",
+    # --- CF ---
+    "oper_cf_period": lambda ctx, v: v.n_period,
+    "oper_cf_trend": lambda ctx, v: choice_sent(["플러스 유지","변동성 확대","완만한 증가"]),
+    "oper_cf_start_year": lambda ctx, v: v.sy1,
+    "oper_cf_start_val": lambda ctx, v: v.oper_cf5[2],
+    "oper_cf_end_year": lambda ctx, v: v.sy3,
+    "oper_cf_end_val": lambda ctx, v: v.oper_cf5[4],
+    "oper_cf_event": "운전자본 변동",
+    "oper_cf_event_size": lambda ctx, v: f"{random.randint(3,30)}",
+    "invest_cf_comment": "설비/개발 투자 확대",
+    "invest_cf_outflow": lambda ctx, v: f"{abs(v.invest_cf[-1])}",
+    "invest_cf_direction": "지속 집행",
+    "invest_cf_year": lambda ctx, v: v.sy3,
+    "invest_cf_event": "CAPEX/인수",
+    "invest_cf_amount": lambda ctx, v: f"{abs(v.invest_cf[-1])}",
+    "fin_cf_equity": lambda ctx, v: f"{random.randint(5,80)}",
+    "fin_cf_equity_year": lambda ctx, v: v.sy2,
+    "fin_cf_short_borrow": lambda ctx, v: f"{random.randint(5,80)}",
+    "fin_cf_long_repay": lambda ctx, v: f"{random.randint(5,80)}",
+    "dividend_amount": lambda ctx, v: f"{random.randint(0,50)}",
+    "dividend_year": lambda ctx, v: v.sy3,
+    "dividend_ratio": lambda ctx, v: f"{pct(0,60,1)}",
+    "oper_cf_1": lambda ctx, v: v.oper_cf5[0],
+    "oper_cf_2": lambda ctx, v: v.oper_cf5[1],
+    "oper_cf_3": lambda ctx, v: v.oper_cf5[2],
+    "oper_cf_4": lambda ctx, v: v.oper_cf5[3],
+    "oper_cf_5": lambda ctx, v: v.oper_cf5[4],
+    "invest_cf_1": lambda ctx, v: v.invest_cf5[0],
+    "invest_cf_2": lambda ctx, v: v.invest_cf5[1],
+    "invest_cf_3": lambda ctx, v: v.invest_cf5[2],
+    "invest_cf_4": lambda ctx, v: v.invest_cf5[3],
+    "invest_cf_5": lambda ctx, v: v.invest_cf5[4],
+    "fin_cf_1": lambda ctx, v: v.fin_cf5[0],
+    "fin_cf_2": lambda ctx, v: v.fin_cf5[1],
+    "fin_cf_3": lambda ctx, v: v.fin_cf5[2],
+    "fin_cf_4": lambda ctx, v: v.fin_cf5[3],
+    "fin_cf_5": lambda ctx, v: v.fin_cf5[4],
+    "cash_1": lambda ctx, v: v.cash5[0],
+    "cash_2": lambda ctx, v: v.cash5[1],
+    "cash_3": lambda ctx, v: v.cash5[2],
+    "cash_4": lambda ctx, v: v.cash5[3],
+    "cash_5": lambda ctx, v: v.cash5[4],
+    # --- Forecast ---
+    "revenue_start_year": lambda ctx, v: v.sy3,
+    "revenue_end_year": lambda ctx, v: str(v.y3+5),
+    "revenue_start": lambda ctx, v: f"{v.r3}억 원",
+    "revenue_end": lambda ctx, v: f"{int(v.r3*(1+v.cagr/100)**5)}억 원",
+    "revenue_cagr": lambda ctx, v: f"{v.cagr}%",
+    "profit_drivers": lambda ctx, v: choice_sent(["제품 믹스 개선","단가 인상","수율 향상","규모의 경제"]),
+    "profit_margin_start": lambda ctx, v: f"{ctx['opm_start']}%",
+    "profit_margin_end": lambda ctx, v: f"{ctx['opm_end']}%",
+    "debt_reduction_plan": "리파이낸싱·차입 구조 장기화",
+    "financial_restructuring_measures": "비핵심 자산 매각·운전자본 효율화",
+    "cagr_base": lambda ctx, v: f"{v.cagr}%",
+    "base_case_assumption": "수주 정상 진행",
+    "cagr_optimistic": lambda ctx, v: f"{pct(v.cagr+2, v.cagr+8,1)}%",
+    "optimistic_assumption": "신규 고객/해외 수주",
+    "cagr_pessimistic": lambda ctx, v: f"{pct(max(1,v.cagr-6), max(3,v.cagr-1),1)}%",
+    "pessimistic_assumption": "수주 지연·가격 압박",
+    "internal_ir_plan": "추가 투자 유치·IR 활동",
+    "government_policy_impact": "지원/규제 변화 민감",
+    "export_delay_impact": "수출 승인 지연 시 매출 인식 지체",
+    # --- Valuation ---
+    "dcf_method": "FCFF",
+    "dcf_period": lambda ctx, v: f"{v.y3+1}~{v.y3+5}",
+    "dcf_wacc": lambda ctx, v: f"{pct(6,12,1)}%",
+    "dcf_ev_range": lambda ctx, v: f"{int(v.ev*0.9)}억 ~ {int(v.ev*1.1)}억",
+    "dcf_terminal_growth": lambda ctx, v: f"{pct(1.0,3.0,1)}%",
+    "comps_domestic_peers": lambda ctx, v: klist(),
+    "comps_foreign_peers": lambda ctx, v: klist(),
+    "comps_ev_ebitda": lambda ctx, v: f"{v.ev_ebitda}배",
+    "comps_ev_ebitda_avg": lambda ctx, v: f"{round(v.ev_ebitda*random.uniform(0.9,1.1),1)}배",
+    "comps_ev_ebitda_target": lambda ctx, v: f"{round(v.ev_ebitda*random.uniform(0.8,1.1),1)}배",
+    "comps_pe_ratio": lambda ctx, v: f"{pct(8,30,1)}배",
+    "comps_pb_ratio": lambda ctx, v: f"{pct(0.8,4.0,1)}배",
+    "benchmark_name": "업계 평균",
+    "benchmark_ev_ebitda": lambda ctx, v: f"{round(v.ev_ebitda*random.uniform(0.95,1.05),1)}배",
+    "benchmark_pe": lambda ctx, v: f"{pct(10,28,1)}배",
+    "benchmark_pb": lambda ctx, v: f"{pct(1.2,3.0,1)}배",
+    "target_name": lambda ctx, v: ctx["name"].replace("주식회사 ",""),
+    "target_ev_ebitda": lambda ctx, v: f"{v.ev_ebitda}배",
+    "target_pe": lambda ctx, v: f"{pct(8,26,1)}배",
+    "target_pb": lambda ctx, v: f"{pct(1.0,3.0,1)}배",
+    "precedent_period": "5",
+    "precedent_count": lambda ctx, v: str(random.randint(3,7)),
+    "precedent_ev_rev_multiple": lambda ctx, v: f"{v.ev_rev}배",
+    "precedent_ev_ebitda_multiple": lambda ctx, v: f"{v.ev_ebitda}배",
+    "deal_value_1": lambda ctx, v: str(int(v.ev*random.uniform(0.6,1.2))),
+    "ev_rev_1": lambda ctx, v: f"{pct(max(0.8,v.ev_rev-0.6), v.ev_rev+0.6,1)}배",
+    "ev_ebitda_1": lambda ctx, v: f"{pct(max(4,v.ev_ebitda-2), v.ev_ebitda+2,1)}배",
+    "acquirer_1": lambda ctx, v: company_name().replace("주식회사 ",""),
+    "target_1": lambda ctx, v: company_name().replace("주식회사 ",""),
+    "deal_value_2": lambda ctx, v: str(int(v.ev*random.uniform(0.6,1.2))),
+    "ev_rev_2": lambda ctx, v: f"{pct(max(0.8,v.ev_rev-0.6), v.ev_rev+0.6,1)}배",
+    "ev_ebitda_2": lambda ctx, v: f"{pct(max(4,v.ev_ebitda-2), v.ev_ebitda+2,1)}배",
+    "acquirer_2": lambda ctx, v: company_name().replace("주식회사 ",""),
+    "target_2": lambda ctx, v: company_name().replace("주식회사 ",""),
+    "deal_value_3": lambda ctx, v: str(int(v.ev*random.uniform(0.6,1.2))),
+    "ev_rev_3": lambda ctx, v: f"{pct(max(0.8,v.ev_rev-0.6), v.ev_rev+0.6,1)}배",
+    "ev_ebitda_3": lambda ctx, v: f"{pct(max(4,v.ev_ebitda-2), v.ev_ebitda+2,1)}배",
+    "acquirer_3": lambda ctx, v: company_name().replace("주식회사 ",""),
+    "target_3": lambda ctx, v: company_name().replace("주식회사 ",""),
+    # --- Valuation result ---
+    "val_method_1": "DCF", "val_method_2": "Comps", "val_method_3": "Precedent",
+    "val_ev_1": lambda ctx, v: f"{v.ev}억 원",
+    "val_eq_1": lambda ctx, v: f"{ctx['eq']}억 원",
+    "val_pps_1": lambda ctx, v: ctx["pps"],
+    "val_ev_2": lambda ctx, v: f"{int(v.ev*random.uniform(0.9,1.1))}억 원",
+    "val_multiple_2": lambda ctx, v: f"EV/EBITDA {v.ev_ebitda}배",
+    "val_ev_3": lambda ctx, v: f"{int(v.ev*random.uniform(0.8,1.0))}억 원",
+    "val_multiple_3": lambda ctx, v: f"EV/Rev {v.ev_rev}배",
+    "val_range_low": lambda ctx, v: f"{int(v.ev*0.9)}억 원",
+    "val_low_comment": "보수적 가정",
+    "val_range_high": lambda ctx, v: f"{int(v.ev*1.1)}억 원",
+    "val_high_comment": "낙관적 가정",
+    "val_range_margin": lambda ctx, v: f"{pct(3,8,1)}%",
+    "val_irr_target": lambda ctx, v: f"{pct(12,25,1)}%",
+    "val_negotiation_scenario": "투자자-창업주 밸류 괴리 조정 필요",
+    # --- 민감도 ---
+    "wacc_delta": lambda ctx, v: f"{pct(0.5,2.0,1)}",
+    "wacc_impact": lambda ctx, v: f"{pct(3,10,1)}",
+    "growth_delta": lambda ctx, v: f"{pct(0.3,1.5,1)}",
+    "growth_impact": lambda ctx, v: f"{pct(3,9,1)}",
+    "ebitda_delta": lambda ctx, v: f"{pct(1,4,1)}",
+    "ev_impact": lambda ctx, v: f"{random.randint(50,500)}",
+    "wacc_1": lambda ctx, v: f"{pct(6,8,1)}%", "wacc_2": lambda ctx, v: f"{pct(8,9,1)}%", "wacc_3": lambda ctx, v: f"{pct(9,10,1)}%", "wacc_4": lambda ctx, v: f"{pct(10,12,1)}%",
+    "growth_1": lambda ctx, v: f"{pct(1.0,1.8,1)}%", "growth_2": lambda ctx, v: f"{pct(2.0,2.6,1)}%", "growth_3": lambda ctx, v: f"{pct(2.7,3.5,1)}%",
+    "val_11": lambda ctx, v: str(random.randint(150,300)), "val_12": lambda ctx, v: str(random.randint(140,280)),
+    "val_13": lambda ctx, v: str(random.randint(130,260)), "val_14": lambda ctx, v: str(random.randint(120,240)),
+    "val_21": lambda ctx, v: str(random.randint(160,320)), "val_22": lambda ctx, v: str(random.randint(150,300)),
+    "val_23": lambda ctx, v: str(random.randint(140,280)), "val_24": lambda ctx, v: str(random.randint(130,260)),
+    "val_31": lambda ctx, v: str(random.randint(170,340)), "val_32": lambda ctx, v: str(random.randint(160,320)),
+    "val_33": lambda ctx, v: str(random.randint(150,300)), "val_34": lambda ctx, v: str(random.randint(140,280)),
+    "sensitivity_conclusion1": "WACC·성장률에 높은 민감도",
+    "sensitivity_conclusion2": "EBITDA 마진 변화 시 EV 변동 폭 큼",
+    # --- 리스크 상세/대응 ---
+    "fin_risk_title1": "차입 구조 불안정", "fin_risk_detail1": "단기차입 만기 집중", "fin_risk_detail2":"리파이낸싱 필요",
+    "fin_risk_title2": "현금흐름 변동성", "fin_risk_detail3": "운전자본 소요 확대", "fin_risk_detail4": "계절성 수주",
+    "fin_risk_title3": "이익 변동성", "fin_risk_detail5":"환율·원자재 가격 영향", "fin_risk_detail6":"단가 인하 압박",
+    "operational_risk_title1":"핵심 인력 의존", "operational_risk_detail1":"R&D 인력 이탈 리스크", "operational_risk_detail2":"프로세스 미비",
+    "operational_risk_title2":"공급망 제약", "operational_risk_detail3":"특정 협력사 의존", "operational_risk_detail4":"대체선 부족",
+    "operational_risk_title3":"내부 통제", "operational_risk_detail5":"매출 인식 지연", "operational_risk_detail6":"원가 집계 지연",
+    "market_risk_title1":"수요 변동성", "market_risk_detail1":"경기·정책 민감", "market_risk_detail2":"고객 이탈 시 리스크",
+    "market_risk_title2":"경쟁 심화", "market_risk_detail3":"해외 경쟁사 진입", "market_risk_detail4":"가격 경쟁 격화",
+    "market_risk_title3":"규모의 경제 미흡", "market_risk_detail5":"단가 인하 대응력 약화", "market_risk_detail6":"마케팅 투자 필요",
+    "domestic_regulation":"국내 규제 강화", "domestic_impact":"인증·비용 증가",
+    "policy_variable":"정책 불확실성", "policy_impact":"투자 지연·수요 위축",
+    "approval_target":"신제품 인증/허가", "approval_impact":"출시 지연·매출 인식 지체",
+    "foreign_region":"해외 시장", "foreign_policy":"데이터/수출 제한", "foreign_impact":"현지 JV 필요",
+    "jv_negotiation_status":"지분·지배 구조 협상 진행",
+    "region_domestic":"국내", "regulation_domestic":"개보법/ESG", "impact_domestic":"비용 증가",
+    "region_agency":"국방부/규제기관", "regulation_agency":"과제/인허가", "impact_agency":"지연 가능",
+    "region_foreign1":"미국", "regulation_foreign1":"ITAR", "impact_foreign1":"승인 지연",
+    "region_foreign2":"EU", "regulation_foreign2":"데이터 국외반출", "impact_foreign2":"현지화 필요",
+    "financial_risk_strategy":"만기 분산·금리 스왑 등",
+    "financial_refinancing_status":"주요 은행과 조건 협의",
+    "operational_risk_retention":"핵심 인력 리텐션 프로그램",
+    "operational_control_improvement":"ERP/내부통제 개선",
+    "market_risk_new_clients":"신규 산업군 공략",
+    "market_risk_contract_terms":"SLA/위약금 조항 강화",
+    "regulatory_risk_consulting":"인증 전문 인력 확충",
+    "regulatory_risk_team_setup":"규제 대응 전담팀 신설",
+    "risk_high":"고위험(High) : 고객 집중, 단기차입",
+    "risk_medium":"중위험(Medium) : 환율·규제 변수",
+    "risk_low":"저위험(Low) : 내부 시스템 개선 이슈",
+    # --- 투자 구조 상세/계약 ---
+    "equity_investment_details":"보통주·우선주 발행 통한 자본 확충",
+    "convertible_investment_details":"전환사채 기반 하방 방어",
+    "mezzanine_investment_details":"부채·자본 성격 병행",
+    "internal_review_result":"보통주 단독은 비효율, 혼합 구조 적정",
+    "investment_structure".lower(): "혼합(신주+구주)",
+    "new_investors":"신규 투자자",
+    "new_investor_share": lambda ctx, v: f"{pct(10,35,1)}%",
+    "new_investor_cond": "성과 조건부",
+    "founder_share_after": "창업주 지분 희석 관리",
+    "strategic_investors_after":"전략투자자 일부 Exit 가능",
+    "shareholder_change_note":"지분 구조 변동성 존재",
+    "exit_negotiation_note":"블록딜/협상 여지",
+    "founder_defense_note":"우호 지분 확보 논의",
+    "pref_share_cond":"우선주 권리", "pref_share_value":"배당률/청산우선권",
+    "drag_tag_cond":"Drag/Tag", "drag_tag_value":"동반매도/매수권",
+    "protective_provisions":"보호조항", "provisions_value":"중요안건 동의",
+    "investor_targets":"내부 목표", "targets_value":"IRR/MOIC",
+    "valuation_point":"신주 발행가", "valuation_value":lambda ctx, v: f"EV {v.ev}억 기준",
+    "lockup_cond":"Lock-up", "lockup_value":lambda ctx, v: f"{random.randint(1,4)}년",
+    "option_cond":"옵션", "option_value":"성과 조건부 콜옵션",
+    "internal_review":"조건 미일치 시 결렬 위험",
+    # --- Exit 시뮬 ---
+    "ipo_market": lambda ctx, v: random.choice(["KOSDAQ","KOSPI","NASDAQ"]),
+    "ipo_year": lambda ctx, v: str(v.now.year+random.randint(2,5)),
+    "ipo_valuation": lambda ctx, v: f"{int(v.ev*random.uniform(1.3,1.8))}억 원",
+    "ipo_irr": lambda ctx, v: f"{pct(12,28,1)}%",
+    "ipo_risk":"시장 침체/규제 변수",
+    "mna_foreign_investors": lambda ctx, v: klist(item="회사"),
+    "mna_domestic_investors": lambda ctx, v: klist(item="회사"),
+    "mna_probability": lambda ctx, v: f"{pct(20,70,1)}%",
+    "mna_negotiation_status":"비공개 타진/예비 협의",
+    "secondary_desc":"재무적 투자자 대상 지분 매각",
+    "secondary_condition":"블록딜 할인률 고려",
+    "buyback_feasibility":"현금흐름 제약으로 제한적",
+    "buyback_short_term":"단기 실행 현실성 낮음",
+    "sim_ipo_irr": lambda ctx, v: f"{pct(12,28,1)}%", "sim_ipo_moic": lambda ctx, v: f"{pct(1.5,2.4,1)}배",
+    "sim_mna_irr": lambda ctx, v: f"{pct(10,22,1)}%", "sim_mna_moic": lambda ctx, v: f"{pct(1.3,2.0,1)}배",
+    "sim_secondary_irr": lambda ctx, v: f"{pct(8,16,1)}%", "sim_secondary_moic": lambda ctx, v: f"{pct(1.1,1.6,1)}배",
+    "sim_ipo_additional":"상장 시기 민감",
+    "sim_mna_additional":"지분율·경영권 이슈",
+    "sim_secondary_additional":"유동성·할인율 변수",
+    # --- 결론/액션 ---
+    "final_recommendation": lambda ctx, v: random.choice(["Invest","Conditional Invest","Reject"]),
+    "final_recommendation_rationale":"성장성 대비 리스크 균형 고려",
+    "condition_1":"차입 구조 개선", "condition_2":"핵심 인력 리텐션", "condition_3":"규제 대응 로드맵",
+    "positive_factor_1":"성장 시장·핵심 고객 확보",
+    "positive_factor_2":"제품 경쟁력·가격 우위",
+    "positive_factor_3":"해외 확장 잠재력",
+    "negative_factor_1":"고객 집중·수요 변동",
+    "negative_factor_2":"규제·인증 지연 리스크",
+    "negative_factor_3":"운전자본 부담",
+    "action_short_1":"리파이낸싱 추진", "action_short_2":"계약 재협상", "action_short_3":"규제 컨설팅 착수",
+    "action_mid_1":"신규 사업부 KPI 관리", "action_mid_2":"리텐션 프로그램", "action_mid_3":"ESG 체계 구축",
+    "action_long_1":"IPO/M&A 준비", "action_long_2":"해외 채널 확장", "action_long_3":"정기 IR 체계",
+    "forecast_revenue": lambda ctx, v: f"CAGR {v.cagr}% 가정",
+    "forecast_profit": "영업이익률 점진 개선",
+    "forecast_debt_ratio": lambda ctx, v: f"{pct(60,90,0)}% 목표",
+    "forecast_exit": lambda ctx, v: f"{random.randint(3,5)}년 내 IPO/M&A",
+    # --- 부록/인터뷰/출처 ---
+    "fin_years": "5",
+    "income_sales_start": lambda ctx, v: f"{v.revs[-5] if len(v.revs)>=5 else v.revs[0]}억", "income_sales_end": lambda ctx, v: f"{v.r3}억",
+    "income_period": lambda ctx, v: f"{len(ctx['years'])}년", "income_cagr": lambda ctx, v: f"{v.cagr}",
+    "balance_assets_start": lambda ctx, v: f"{v.a1}억", "balance_assets_end": lambda ctx, v: f"{v.a3}억",
+    "balance_debt_ratio_start": lambda ctx, v: f"{int(v.dr1)}", "balance_debt_ratio_end": lambda ctx, v: f"{int(v.dr3)}",
+    "cashflow_operating": lambda ctx, v: f"{v.oper_cf[-1]}억", "cashflow_investing": lambda ctx, v: f"{v.invest_cf[-1]}억", "cashflow_financing": lambda ctx, v: f"{v.fin_cf[-1]}억", "cashflow_year": lambda ctx, v: f"{v.y3}",
+    "division_1_name": lambda ctx, v: v.prods[0], "division_1_sales": lambda ctx, v: f"{int(v.r3*random.uniform(0.3,0.6))}억", "division_1_ratio": lambda ctx, v: f"{pct(30,60,1)}", "division_1_margin": lambda ctx, v: f"{pct(8,20,1)}",
+    "division_2_name": lambda ctx, v: v.prods[1] if len(v.prods)>1 else "신사업", "division_2_sales": lambda ctx, v: f"{int(v.r3*random.uniform(0.2,0.5))}억", "division_2_ratio": lambda ctx, v: f"{pct(20,50,1)}", "division_2_margin": lambda ctx, v: f"{pct(5,15,1)}",
+    "division_3_name": "서비스/유지보수", "division_3_sales": lambda ctx, v: f"{int(v.r3*random.uniform(0.1,0.3))}억", "division_3_ratio": lambda ctx, v: f"{pct(10,30,1)}", "division_3_margin": lambda ctx, v: f"{pct(5,20,1)}",
+    "data_source_domestic":"KOSIS, 산업부, KRX", "data_source_global":"Bloomberg, Capital IQ", "data_source_report":"증권사 산업리포트", "data_source_internal":"내부 설문/조달 데이터",
+    "ceo_quote":"핵심 제품 해외 진출 가속", "ceo_note":"전략 고객 확보 최우선",
+    "cfo_name": lambda ctx, v: _role_person(ctx, "CFO"), "cfo_quote":"유동성 리스크 선제 대응", "cfo_note":"만기 분산·금리 헤지",
+    "cto_name": lambda ctx, v: _role_person(ctx, "CTO"), "cto_quote":"제품 신뢰성·효율 고도화", "cto_note":"인증 로드맵 추진",
+    "client_quote":"공급 안정성·기술 지원 중요", "client_note":"SLA 강화 필요",
+    "supplier_name": lambda ctx, v: company_name().replace("주식회사 ",""), "supplier_quote":"단가·납기 협상 진행",
+    "law_name":"관련 법령", "law_year": lambda ctx, v: str(yr()), "court_name":"○○지법",
+    "guideline_source":"정부 가이드라인", "guideline_year": lambda ctx, v: str(yr()),
+    "email_date": lambda ctx, v: f"{v.now.year}.{random.randint(1,12):02d}",
+    "cfo_memo":"단기 유동성 관리 필요",
+    "ceo_memo":"해외 파트너십·JV 협상 중",
+    "report_source":"산업 리포트", "report_year": lambda ctx, v: str(yr()),
+    "paper_title":"학술 논문 제목", "paper_source":"저널명", "paper_year": lambda ctx, v: str(yr()),
+    "news_title":"산업 동향 기사", "news_source":"Daily Biz", "news_date": lambda ctx, v: f"{v.now.year}.{random.randint(1,12):02d}",
+    "harvard_citation":"Hong, J. (2024). Market.", "apa_citation":"Kim (2023). Journal, 12(2).",
+}
+
 def gen_known_value(key:str, ctx:dict):
-    years = ctx["years"]; revs=ctx["revs"]; op=ctx["op"]; net=ctx["net"]; ebitda=ctx["ebitda"]
-    assets=ctx["assets"]; liabs=ctx["liabs"]; equity=ctx["equity"]; dr=ctx["debt_ratio"]; cr=ctx["cur_ratio"]
-    comps=ctx["comps"]
-
-    mapping = {
-        # --- 회사/기본 ---
-        "target_company": ctx["name"],
-        "company_name": ctx["name"],
-        "registration_no": f"{random.randint(100,999)}-{random.randint(10,99)}-{random.randint(10000,99999)}",
-        "registration_number": f"{random.randint(100,999)}-{random.randint(10,99)}-{random.randint(10000,99999)}",
-        "report_date": f"{datetime.now().year}. {datetime.now().month:02d}. {datetime.now().day:02d}",
-        "hq_address": address(),
-        "hq_description": phrase("hq_desc", ctx),
-        "hq_desc": phrase("hq_desc", ctx),
-        "business_sector": ctx["sector"],
-        "business_products": ", ".join(ctx["prof"]["products"]),
-        "shareholders": f"최대주주 및 특수관계인, 전략투자자, 임직원·소액주주로 구성",
-        "major_shareholders": f"{person()} 외 {random.randint(1,3)}인",
-        "major_share_ratio": f"{pct(25,60,1)}%",
-        "affiliate_company": company_name(),
-        "affiliate_ratio": f"{pct(10,45,1)}%",
-        "minority_shareholders": "임직원·소액주주",
-        "clients": klist(item="회사"),
-        "products": ", ".join(ctx['prof']['products'][:min(3,len(ctx['prof']['products']))]),
-        "financials": f"{years[-1]}년 매출 {revs[-1]}억 원, 영업이익 {op[-1]}억 원, 임직원 {random.randint(20,2000)}명",
-        # --- 목적/배경/포인트 ---
-        "strategic_objectives": phrase("purpose_strategic", ctx),
-        "financial_objectives": phrase("purpose_financial", ctx),
-        "policy_environment": f"{ctx['prof']['reg']} 관련 정책 변화 모니터링 필요",
-        "tech_competitiveness": choice_sent([
-            "핵심 기술 내재화 및 특허 포트폴리오 보유",
-            "제품 신뢰성·효율 개선에 따른 TCO 강점",
-            "고부가가치 제품 믹스 전환 진행"
-        ]),
-        "growth_potential": choice_sent([
-            f"핵심 고객군 확대 및 {ctx['sector']} 수요 성장",
-            f"해외 시장 진출 가속 및 파트너십 확대",
-            "제품 라인업 확장과 단가 개선 여지"
-        ]),
-        "hr_advantage": choice_sent([
-            "핵심 연구인력 다수 보유, 이직률 낮음",
-            "산업 도메인 전문가 중심의 조직",
-            "내부 교육·채용 파이프라인 확보"
-        ]),
-        "market_position": phrase("market_pos", ctx),
-        # --- 리스크 요약 ---
-        "risk_financial": phrase("risk_fin", ctx),
-        "risk_business": phrase("risk_biz", ctx),
-        "risk_tech": phrase("risk_tech", ctx),
-        "risk_operational": phrase("risk_op", ctx),
-        "sensitive_risks": phrase("sensitive", ctx),
-        # --- 투자 구조/조건 ---
-        "investment_structure": random.choice(["Equity","Convertible","Mezzanine","혼합(신주+구주)"]),
-        "investment_amount": money_from_rev(revs[-1], 0.15, 0.6),
-        "investment_preference_terms": "우선주 배당/청산우선권·보호조항 등 투자자 권리 확보",
-        "drag_tag_rights": "동반매도·매수권 반영(주요 거래 시 의무 적용)",
-        "governance_participation": "이사회 1석·중요안건 동의권",
-        "additional_conditions": "기술·법무·세무 DD 완료 후 집행",
-        # --- Exit ---
-        "exit_ipo_domestic": random.choice(["KOSDAQ","KOSPI"])+" 상장 추진",
-        "exit_mna_strategic": "전략적 투자자 대상 매각 가능성",
-        "exit_secondary": "재무적 투자자 대상 블록딜",
-        "exit_share_buyback": "현금흐름 호전 시 자사주 매입",
-        "exit_risk": "시장 침체/규제 변수로 일정 지연 가능",
-        # --- 타임라인 ---
-        "deal_review_start": "내부 투자심의 승인 후 비공개 검토 시작",
-        "deal_review_date": f"{datetime.now().year}년 {random.randint(1,12)}월",
-        "due_diligence": "재무·세무·법무·기술 전 영역 실사",
-        "due_diligence_date": f"{datetime.now().year}년 {random.randint(1,12)}월",
-        "contract_negotiation": "밸류·우선주 구조·보호조항 협상",
-        "contract_negotiation_date": f"{datetime.now().year+1}년 {random.randint(1,12)}월",
-        "contract_signing": "SHA/SPA 체결",
-        "contract_signing_date": f"{datetime.now().year+1}년 {random.randint(1,12)}월",
-        "capital_injection_and_transfer": "납입 및 지분 이전",
-        "capital_injection_date": f"{datetime.now().year+1}년 {random.randint(1,12)}월",
-        "post_management_date": f"{datetime.now().year+1}년 {random.randint(1,12)}월 이후 정기 모니터링",
-        # --- 회사 연혁/지배구조 ---
-        "company_foundation": f"{random.randint(1995,2023)}년 설립 → 법인 전환 {random.randint(2000,2024)}년",
-        "company_growth_stage": choice_sent(["창업기","성장기","확장기","성숙기"]),
-        "company_milestones": "핵심 제품 상용화·주요 고객사 확보·해외 파트너십",
-        "company_diversification": "주요 시장 외 인접 영역 확장",
-        "company_current_status": "R&D·생산·영업 조직 균형적 운영",
-        "board_composition": "이사회 5인(사내 2, 사외 3), 감사 1",
-        "board_ceo": person("CEO"),
-        "board_cfo": person("CFO"),
-        "board_cto": person("CTO"),
-        "board_others": person("사외이사"),
-        "governance_structure": "오너 중심이나 외부 이사 견제 장치 보유",
-        # --- BM/수익 ---
-        "revenue_model": choice_sent(["구독+라이선스+서비스","제품판매+유지보수","프로젝트+소모품"]),
-        "revenue_b2g": money_from_rev(revs[-1],0.1,0.6),
-        "revenue_b2b": money_from_rev(revs[-1],0.2,0.7),
-        "revenue_b2c": money_from_rev(revs[-1],0.0,0.4),
-        "revenue_service": money_from_rev(revs[-1],0.05,0.3),
-        "b2g_share": f"{pct(0,60,1)}%",
-        "b2b_share": f"{pct(10,80,1)}%",
-        "b2c_share": f"{pct(0,40,1)}%",
-        "service_share": f"{pct(5,40,1)}%",
-        "key_revenue_sources": ", ".join(ctx["prof"]["products"]),
-        "business_strategy": choice_sent(["고마진 제품 믹스 확대","전략 고객 장기계약","해외 파트너 채널 구축"]),
-        # --- 제품/서비스 ---
-        "product_service_a": ctx["prof"]["products"][0],
-        "product_service_b": ctx["prof"]["products"][1] if len(ctx["prof"]["products"])>1 else "신규 라인업",
-        "product_service_c": ctx["prof"]["products"][2] if len(ctx["prof"]["products"])>2 else "서비스 패키지",
-        "product_service_d": "유지보수/운영 서비스",
-        # --- 시장/경쟁 ---
-        "total_addressable_market": money_억( int(revs[-1]*20), int(revs[-1]*300), 10),
-        "serviceable_available_market": money_억( int(revs[-1]*8), int(revs[-1]*150), 5),
-        "serviceable_obtainable_market": money_억( int(revs[-1]*3), int(revs[-1]*60), 5),
-        "target_customer_segments": ", ".join(ctx["prof"]["customers"]),
-        "additional_market_info": phrase("market_pos", ctx),
-        "competitor_a_name": comps[0]["name"], "competitor_b_name": comps[1]["name"], "competitor_c_name": comps[2]["name"],
-        "competitor_a_profile": f"{ctx['sector']} 주력, 고객 {comps[0]['clients']}",
-        "competitor_b_profile": f"{ctx['sector']} 확대 중, 고객 {comps[1]['clients']}",
-        "competitor_c_profile": f"틈새 강점, 기술 {comps[2]['tech']}",
-        "competitor_a_internal_note": "제품 라인 안정적이나 혁신 속도 제한",
-        "competitor_b_eval_note": "수익성 저하·납기 이슈로 감점",
-        "competitor_c_tech_note": "기술 우수하나 영업 네트워크 약함",
-        "competitor_a_revenue": f"{comps[0]['rev']}억원",
-        "competitor_b_revenue": f"{comps[1]['rev']}억원",
-        "competitor_c_revenue": f"{comps[2]['rev']}억원",
-        "competitor_a_share": f"{comps[0]['share']}%",
-        "competitor_b_share": f"{comps[1]['share']}%",
-        "competitor_c_share": f"{comps[2]['share']}%",
-        "target_revenue": f"{revs[-1]}억원",
-        "competitor_a_clients": comps[0]["clients"], "competitor_b_clients": comps[1]["clients"], "competitor_c_clients": comps[2]["clients"], "target_clients": random.choice(ctx["prof"]["customers"]),
-        "competitor_a_tech": comps[0]["tech"], "competitor_b_tech": comps[1]["tech"], "competitor_c_tech": comps[2]["tech"], "target_tech": random.choice(ctx["prof"]["products"]),
-        "competitor_a_risk": comps[0]["risk"], "competitor_b_risk": comps[1]["risk"], "competitor_c_risk": comps[2]["risk"], "target_risk": "원가/환율/규제",
-        "additional_competitor_info": "신규 진입자·대체재 동향 주기적 점검",
-        # --- 규제 ---
-        "regulatory_environment_current": f"{ctx['prof']['reg']} 규제·인증 요건 존재",
-        "policy_changes_future": "지원정책/규제완화·강화 불확실성",
-        "regulatory_risk_summary": "인증·승인 지연 시 매출 인식 지체 가능",
-        # --- P/L 표 ---
-        "year_1": str(years[-3]), "year_2": str(years[-2]), "year_3": str(years[-1]),
-        "revenue_year1": str(revs[-3]), "revenue_year2": str(revs[-2]), "revenue_year3": str(revs[-1]),
-        "op_profit_year1": str(int(op[-3])), "op_profit_year2": str(int(op[-2])), "op_profit_year3": str(int(op[-1])),
-        "net_profit_year1": str(int(net[-3])), "net_profit_year2": str(int(net[-2])), "net_profit_year3": str(int(net[-1])),
-        "op_margin_year1": f"{round(op[-3]/revs[-3]*100,1)}", "op_margin_year2": f"{round(op[-2]/revs[-2]*100,1)}", "op_margin_year3": f"{round(op[-1]/revs[-1]*100,1)}",
-        "is_revenue": f"{years[-3]}~{years[-1]} 매출 {revs[-3]}→{revs[-1]}억",
-        "is_revenue_trend": f"CAGR {ctx['cagr']}%",
-        "is_op_profit": f"영업이익 {int(op[-3])}→{int(op[-1])}억",
-        "is_op_profit_reason": "제품 믹스 개선·원가 절감",
-        "is_net_profit": f"순이익 {int(net[-3])}→{int(net[-1])}억",
-        "is_net_profit_comment": "판관비 효율화·금융비용 변동",
-        # --- BS 표 ---
-        "balancesheet_year_1": str(years[-3]),
-        "balancesheet_year_2": str(years[-2]),
-        "balancesheet_year_3": str(years[-1]),
-        "balancesheet_totalassets_1": str(assets[-3]),
-        "balancesheet_totalassets_2": str(assets[-2]),
-        "balancesheet_totalassets_3": str(assets[-1]),
-        "balancesheet_totalliabilities_1": str(liabs[-3]),
-        "balancesheet_totalliabilities_2": str(liabs[-2]),
-        "balancesheet_totalliabilities_3": str(liabs[-1]),
-        "balancesheet_equity_1": str(equity[-3]),
-        "balancesheet_equity_2": str(equity[-2]),
-        "balancesheet_equity_3": str(equity[-1]),
-        "balancesheet_debtratio_1": str(int(dr[-3])),
-        "balancesheet_debtratio_2": str(int(dr[-2])),
-        "balancesheet_debtratio_3": str(int(dr[-1])),
-        "balancesheet_currentratio_1": str(int(cr[-3])),
-        "balancesheet_currentratio_2": str(int(cr[-2])),
-        "balancesheet_currentratio_3": str(int(cr[-1])),
-        "fin_performance_keypoint": "수익성 개선·운전자본 효율화 필요",
-        # --- 지표 추이 ---
-        "roe_start_year": str(years[-5]) if len(years)>=5 else str(years[0]),
-        "roe_end_year": str(years[-1]),
-        "roe_start_val": f"{pct(3,10,1)}",
-        "roe_end_val": f"{pct(6,18,1)}",
-        "roe_period": str(len(years)-1),
-        "roe_change": f"{pct(1,6,1)}",
-        "roa_start_year": str(years[-5]) if len(years)>=5 else str(years[0]),
-        "roa_end_year": str(years[-1]),
-        "roa_start_val": f"{pct(1,6,1)}",
-        "roa_end_val": f"{pct(2,10,1)}",
-        "roa_comment": "자산 효율성 점진 개선",
-        "ebitda_start_year": str(years[-5]) if len(years)>=5 else str(years[0]),
-        "ebitda_start_val": f"{pct(max(5,ctx['ebitda_m']-5), ctx['ebitda_m'],1)}",
-        "ebitda_end_year": str(years[-1]),
-        "ebitda_end_val": f"{pct(ctx['ebitda_m'], min(35, ctx['ebitda_m']+6),1)}",
-        "ebitda_comment": "규모의 경제·원가 구조 개선",
-        "debt_ratio_start_year": str(years[-3]),
-        "debt_ratio_start": f"{int(dr[-3])}",
-        "debt_ratio_end_year": str(years[-1]),
-        "debt_ratio_end": f"{int(dr[-1])}",
-        "debt_ratio_comment": "리파이낸싱·만기 분산 필요",
-        "liquidity_start_year": str(years[-3]),
-        "liquidity_start": f"{int(cr[-3])}",
-        "liquidity_end_year": str(years[-1]),
-        "liquidity_end": f"{int(cr[-1])}",
-        "liquidity_comment": "운전자본 관리 강화",
-        "debt_dep_start": f"{pct(15,40,1)}",
-        "debt_dep_end": f"{pct(15,45,1)}",
-        "debt_dep_comment": "차입 의존도 관리 필요",
-        "sales_period": str(len(years)-1),
-        "sales_cagr": f"{ctx['cagr']}",
-        "op_profit_period": str(len(years)-1),
-        "op_profit_cagr": f"{pct(max(3,ctx['cagr']-3), ctx['cagr']+3,1)}",
-        "years": str(len(years)-1),
-        "project_effect": "신규 프로젝트 반영 효과",
-        "target_roe_year": str(yr()),
-        "target_roe": f"{pct(10,20,1)}",
-        "risk_scenario": "수주 지연·환율 급등",
-        "low_case_roe": f"{pct(3,8,1)}",
-        "target_irr": f"{pct(12,25,1)}",
-        "actual_irr": f"{pct(6,18,1)}",
-        "impact_comment": "원가·환율 민감도 영향",
-        "special_quarter": f"{years[-1]}년 {random.randint(1,4)}분기",
-        "special_sales": f"{random.randint(5,50)}",
-        "oneoff_project": "일회성 대형 주문",
-        # --- CF ---
-        "oper_cf_period": str(len(years)-1),
-        "oper_cf_trend": choice_sent(["플러스 유지","변동성 확대","완만한 증가"]),
-        "oper_cf_start_year": str(years[-3]),
-        "oper_cf_start_val": str(ctx["oper_cf"][-3]),
-        "oper_cf_end_year": str(years[-1]),
-        "oper_cf_end_val": str(ctx["oper_cf"][-1]),
-        "oper_cf_event": "운전자본 변동",
-        "oper_cf_event_size": f"{random.randint(3,30)}",
-        "invest_cf_comment": "설비/개발 투자 확대",
-        "invest_cf_outflow": f"{abs(ctx['invest_cf'][-1])}",
-        "invest_cf_direction": "지속 집행",
-        "invest_cf_year": str(years[-1]),
-        "invest_cf_event": "CAPEX/인수",
-        "invest_cf_amount": f"{abs(ctx['invest_cf'][-1])}",
-        "fin_cf_equity": f"{random.randint(5,80)}",
-        "fin_cf_equity_year": str(years[-2]),
-        "fin_cf_short_borrow": f"{random.randint(5,80)}",
-        "fin_cf_long_repay": f"{random.randint(5,80)}",
-        "dividend_amount": f"{random.randint(0,50)}",
-        "dividend_year": str(years[-1]),
-        "dividend_ratio": f"{pct(0,60,1)}",
-        "oper_cf_1": str(ctx["oper_cf"][-5]) if len(years)>=5 else "1",
-        "oper_cf_2": str(ctx["oper_cf"][-4]) if len(years)>=4 else "2",
-        "oper_cf_3": str(ctx["oper_cf"][-3]),
-        "oper_cf_4": str(ctx["oper_cf"][-2]),
-        "oper_cf_5": str(ctx["oper_cf"][-1]),
-        "invest_cf_1": str(ctx["invest_cf"][-5]) if len(years)>=5 else "-5",
-        "invest_cf_2": str(ctx["invest_cf"][-4]) if len(years)>=4 else "-4",
-        "invest_cf_3": str(ctx["invest_cf"][-3]),
-        "invest_cf_4": str(ctx["invest_cf"][-2]),
-        "invest_cf_5": str(ctx["invest_cf"][-1]),
-        "fin_cf_1": str(ctx["fin_cf"][-5]) if len(years)>=5 else "3",
-        "fin_cf_2": str(ctx["fin_cf"][-4]) if len(years)>=4 else "4",
-        "fin_cf_3": str(ctx["fin_cf"][-3]),
-        "fin_cf_4": str(ctx["fin_cf"][-2]),
-        "fin_cf_5": str(ctx["fin_cf"][-1]),
-        "cash_1": str(ctx["cash"][-5]) if len(years)>=5 else "5",
-        "cash_2": str(ctx["cash"][-4]) if len(years)>=4 else "6",
-        "cash_3": str(ctx["cash"][-3]),
-        "cash_4": str(ctx["cash"][-2]),
-        "cash_5": str(ctx["cash"][-1]),
-        # --- Forecast ---
-        "revenue_start_year": str(years[-1]),
-        "revenue_end_year": str(years[-1]+5),
-        "revenue_start": f"{revs[-1]}억 원",
-        "revenue_end": f"{int(revs[-1]*(1+ctx['cagr']/100)**5)}억 원",
-        "revenue_cagr": f"{ctx['cagr']}%",
-        "profit_drivers": choice_sent(["제품 믹스 개선","단가 인상","수율 향상","규모의 경제"]),
-        "profit_margin_start": f"{ctx['opm_start']}%",
-        "profit_margin_end": f"{ctx['opm_end']}%",
-        "debt_reduction_plan": "리파이낸싱·차입 구조 장기화",
-        "financial_restructuring_measures": "비핵심 자산 매각·운전자본 효율화",
-        "cagr_base": f"{ctx['cagr']}%",
-        "base_case_assumption": "수주 정상 진행",
-        "cagr_optimistic": f"{pct(ctx['cagr']+2, ctx['cagr']+8,1)}%",
-        "optimistic_assumption": "신규 고객/해외 수주",
-        "cagr_pessimistic": f"{pct(max(1,ctx['cagr']-6), max(3,ctx['cagr']-1),1)}%",
-        "pessimistic_assumption": "수주 지연·가격 압박",
-        "internal_ir_plan": "추가 투자 유치·IR 활동",
-        "government_policy_impact": "지원/규제 변화 민감",
-        "export_delay_impact": "수출 승인 지연 시 매출 인식 지체",
-        # --- Valuation ---
-        "dcf_method": "FCFF",
-        "dcf_period": f"{years[-1]+1}~{years[-1]+5}",
-        "dcf_wacc": f"{pct(6,12,1)}%",
-        "dcf_ev_range": f"{int(ctx['ev']*0.9)}억 ~ {int(ctx['ev']*1.1)}억",
-        "dcf_terminal_growth": f"{pct(1.0,3.0,1)}%",
-        "comps_domestic_peers": klist(),
-        "comps_foreign_peers": klist(),
-        "comps_ev_ebitda": f"{ctx['ev_ebitda']}배",
-        "comps_ev_ebitda_avg": f"{round(ctx['ev_ebitda']*random.uniform(0.9,1.1),1)}배",
-        "comps_ev_ebitda_target": f"{round(ctx['ev_ebitda']*random.uniform(0.8,1.1),1)}배",
-        "comps_pe_ratio": f"{pct(8,30,1)}배",
-        "comps_pb_ratio": f"{pct(0.8,4.0,1)}배",
-        "benchmark_name": "업계 평균",
-        "benchmark_ev_ebitda": f"{round(ctx['ev_ebitda']*random.uniform(0.95,1.05),1)}배",
-        "benchmark_pe": f"{pct(10,28,1)}배",
-        "benchmark_pb": f"{pct(1.2,3.0,1)}배",
-        "target_name": ctx["name"].replace("주식회사 ",""),
-        "target_ev_ebitda": f"{ctx['ev_ebitda']}배",
-        "target_pe": f"{pct(8,26,1)}배",
-        "target_pb": f"{pct(1.0,3.0,1)}배",
-        "precedent_period": "5",
-        "precedent_count": str(random.randint(3,7)),
-        "precedent_ev_rev_multiple": f"{ctx['ev_rev']}배",
-        "precedent_ev_ebitda_multiple": f"{ctx['ev_ebitda']}배",
-        "deal_value_1": str(int(ctx['ev']*random.uniform(0.6,1.2))),
-        "ev_rev_1": f"{pct(max(0.8,ctx['ev_rev']-0.6), ctx['ev_rev']+0.6,1)}배",
-        "ev_ebitda_1": f"{pct(max(4,ctx['ev_ebitda']-2), ctx['ev_ebitda']+2,1)}배",
-        "acquirer_1": company_name().replace("주식회사 ",""),
-        "target_1": company_name().replace("주식회사 ",""),
-        "deal_value_2": str(int(ctx['ev']*random.uniform(0.6,1.2))),
-        "ev_rev_2": f"{pct(max(0.8,ctx['ev_rev']-0.6), ctx['ev_rev']+0.6,1)}배",
-        "ev_ebitda_2": f"{pct(max(4,ctx['ev_ebitda']-2), ctx['ev_ebitda']+2,1)}배",
-        "acquirer_2": company_name().replace("주식회사 ",""),
-        "target_2": company_name().replace("주식회사 ",""),
-        "deal_value_3": str(int(ctx['ev']*random.uniform(0.6,1.2))),
-        "ev_rev_3": f"{pct(max(0.8,ctx['ev_rev']-0.6), ctx['ev_rev']+0.6,1)}배",
-        "ev_ebitda_3": f"{pct(max(4,ctx['ev_ebitda']-2), ctx['ev_ebitda']+2,1)}배",
-        "acquirer_3": company_name().replace("주식회사 ",""),
-        "target_3": company_name().replace("주식회사 ",""),
-        # --- Valuation result ---
-        "val_method_1": "DCF", "val_method_2": "Comps", "val_method_3": "Precedent",
-        "val_ev_1": f"{ctx['ev']}억 원",
-        "val_eq_1": f"{ctx['eq']}억 원",
-        "val_pps_1": ctx["pps"],
-        "val_ev_2": f"{int(ctx['ev']*random.uniform(0.9,1.1))}억 원",
-        "val_multiple_2": f"EV/EBITDA {ctx['ev_ebitda']}배",
-        "val_ev_3": f"{int(ctx['ev']*random.uniform(0.8,1.0))}억 원",
-        "val_multiple_3": f"EV/Rev {ctx['ev_rev']}배",
-        "val_range_low": f"{int(ctx['ev']*0.9)}억 원",
-        "val_low_comment": "보수적 가정",
-        "val_range_high": f"{int(ctx['ev']*1.1)}억 원",
-        "val_high_comment": "낙관적 가정",
-        "val_range_margin": f"{pct(3,8,1)}%",
-        "val_irr_target": f"{pct(12,25,1)}%",
-        "val_negotiation_scenario": "투자자-창업주 밸류 괴리 조정 필요",
-        # --- 민감도 ---
-        "wacc_delta": f"{pct(0.5,2.0,1)}",
-        "wacc_impact": f"{pct(3,10,1)}",
-        "growth_delta": f"{pct(0.3,1.5,1)}",
-        "growth_impact": f"{pct(3,9,1)}",
-        "ebitda_delta": f"{pct(1,4,1)}",
-        "ev_impact": f"{random.randint(50,500)}",
-        "wacc_1": f"{pct(6,8,1)}%", "wacc_2": f"{pct(8,9,1)}%", "wacc_3": f"{pct(9,10,1)}%", "wacc_4": f"{pct(10,12,1)}%",
-        "growth_1": f"{pct(1.0,1.8,1)}%", "growth_2": f"{pct(2.0,2.6,1)}%", "growth_3": f"{pct(2.7,3.5,1)}%",
-        "val_11": str(random.randint(150,300)), "val_12": str(random.randint(140,280)),
-        "val_13": str(random.randint(130,260)), "val_14": str(random.randint(120,240)),
-        "val_21": str(random.randint(160,320)), "val_22": str(random.randint(150,300)),
-        "val_23": str(random.randint(140,280)), "val_24": str(random.randint(130,260)),
-        "val_31": str(random.randint(170,340)), "val_32": str(random.randint(160,320)),
-        "val_33": str(random.randint(150,300)), "val_34": str(random.randint(140,280)),
-        "sensitivity_conclusion1": "WACC·성장률에 높은 민감도",
-        "sensitivity_conclusion2": "EBITDA 마진 변화 시 EV 변동 폭 큼",
-        # --- 리스크 상세/대응 ---
-        "fin_risk_title1": "차입 구조 불안정", "fin_risk_detail1": "단기차입 만기 집중", "fin_risk_detail2":"리파이낸싱 필요",
-        "fin_risk_title2": "현금흐름 변동성", "fin_risk_detail3": "운전자본 소요 확대", "fin_risk_detail4": "계절성 수주",
-        "fin_risk_title3": "이익 변동성", "fin_risk_detail5":"환율·원자재 가격 영향", "fin_risk_detail6":"단가 인하 압박",
-        "operational_risk_title1":"핵심 인력 의존", "operational_risk_detail1":"R&D 인력 이탈 리스크", "operational_risk_detail2":"프로세스 미비",
-        "operational_risk_title2":"공급망 제약", "operational_risk_detail3":"특정 협력사 의존", "operational_risk_detail4":"대체선 부족",
-        "operational_risk_title3":"내부 통제", "operational_risk_detail5":"매출 인식 지연", "operational_risk_detail6":"원가 집계 지연",
-        "market_risk_title1":"수요 변동성", "market_risk_detail1":"경기·정책 민감", "market_risk_detail2":"고객 이탈 시 리스크",
-        "market_risk_title2":"경쟁 심화", "market_risk_detail3":"해외 경쟁사 진입", "market_risk_detail4":"가격 경쟁 격화",
-        "market_risk_title3":"규모의 경제 미흡", "market_risk_detail5":"단가 인하 대응력 약화", "market_risk_detail6":"마케팅 투자 필요",
-        "domestic_regulation":"국내 규제 강화", "domestic_impact":"인증·비용 증가",
-        "policy_variable":"정책 불확실성", "policy_impact":"투자 지연·수요 위축",
-        "approval_target":"신제품 인증/허가", "approval_impact":"출시 지연·매출 인식 지체",
-        "foreign_region":"해외 시장", "foreign_policy":"데이터/수출 제한", "foreign_impact":"현지 JV 필요",
-        "jv_negotiation_status":"지분·지배 구조 협상 진행",
-        "region_domestic":"국내", "regulation_domestic":"개보법/ESG", "impact_domestic":"비용 증가",
-        "region_agency":"국방부/규제기관", "regulation_agency":"과제/인허가", "impact_agency":"지연 가능",
-        "region_foreign1":"미국", "regulation_foreign1":"ITAR", "impact_foreign1":"승인 지연",
-        "region_foreign2":"EU", "regulation_foreign2":"데이터 국외반출", "impact_foreign2":"현지화 필요",
-        "financial_risk_strategy":"만기 분산·금리 스왑 등",
-        "financial_refinancing_status":"주요 은행과 조건 협의",
-        "operational_risk_retention":"핵심 인력 리텐션 프로그램",
-        "operational_control_improvement":"ERP/내부통제 개선",
-        "market_risk_new_clients":"신규 산업군 공략",
-        "market_risk_contract_terms":"SLA/위약금 조항 강화",
-        "regulatory_risk_consulting":"인증 전문 인력 확충",
-        "regulatory_risk_team_setup":"규제 대응 전담팀 신설",
-        "risk_high":"고위험(High) : 고객 집중, 단기차입",
-        "risk_medium":"중위험(Medium) : 환율·규제 변수",
-        "risk_low":"저위험(Low) : 내부 시스템 개선 이슈",
-        # --- 투자 구조 상세/계약 ---
-        "equity_investment_details":"보통주·우선주 발행 통한 자본 확충",
-        "convertible_investment_details":"전환사채 기반 하방 방어",
-        "mezzanine_investment_details":"부채·자본 성격 병행",
-        "internal_review_result":"보통주 단독은 비효율, 혼합 구조 적정",
-        "investment_structure".lower(): "혼합(신주+구주)",
-        "new_investors":"신규 투자자",
-        "new_investor_share": f"{pct(10,35,1)}%",
-        "new_investor_cond": "성과 조건부",
-        "founder_share_after": "창업주 지분 희석 관리",
-        "strategic_investors_after":"전략투자자 일부 Exit 가능",
-        "shareholder_change_note":"지분 구조 변동성 존재",
-        "exit_negotiation_note":"블록딜/협상 여지",
-        "founder_defense_note":"우호 지분 확보 논의",
-        "pref_share_cond":"우선주 권리", "pref_share_value":"배당률/청산우선권",
-        "drag_tag_cond":"Drag/Tag", "drag_tag_value":"동반매도/매수권",
-        "protective_provisions":"보호조항", "provisions_value":"중요안건 동의",
-        "investor_targets":"내부 목표", "targets_value":"IRR/MOIC",
-        "valuation_point":"신주 발행가", "valuation_value":f"EV {ctx['ev']}억 기준",
-        "lockup_cond":"Lock-up", "lockup_value":f"{random.randint(1,4)}년",
-        "option_cond":"옵션", "option_value":"성과 조건부 콜옵션",
-        "internal_review":"조건 미일치 시 결렬 위험",
-        # --- Exit 시뮬 ---
-        "ipo_market": random.choice(["KOSDAQ","KOSPI","NASDAQ"]),
-        "ipo_year": str(datetime.now().year+random.randint(2,5)),
-        "ipo_valuation": f"{int(ctx['ev']*random.uniform(1.3,1.8))}억 원",
-        "ipo_irr": f"{pct(12,28,1)}%",
-        "ipo_risk":"시장 침체/규제 변수",
-        "mna_foreign_investors": klist(item="회사"),
-        "mna_domestic_investors": klist(item="회사"),
-        "mna_probability": f"{pct(20,70,1)}%",
-        "mna_negotiation_status":"비공개 타진/예비 협의",
-        "secondary_desc":"재무적 투자자 대상 지분 매각",
-        "secondary_condition":"블록딜 할인률 고려",
-        "buyback_feasibility":"현금흐름 제약으로 제한적",
-        "buyback_short_term":"단기 실행 현실성 낮음",
-        "sim_ipo_irr": f"{pct(12,28,1)}%", "sim_ipo_moic": f"{pct(1.5,2.4,1)}배",
-        "sim_mna_irr": f"{pct(10,22,1)}%", "sim_mna_moic": f"{pct(1.3,2.0,1)}배",
-        "sim_secondary_irr": f"{pct(8,16,1)}%", "sim_secondary_moic": f"{pct(1.1,1.6,1)}배",
-        "sim_ipo_additional":"상장 시기 민감",
-        "sim_mna_additional":"지분율·경영권 이슈",
-        "sim_secondary_additional":"유동성·할인율 변수",
-        # --- 결론/액션 ---
-        "final_recommendation": random.choice(["Invest","Conditional Invest","Reject"]),
-        "final_recommendation_rationale":"성장성 대비 리스크 균형 고려",
-        "condition_1":"차입 구조 개선", "condition_2":"핵심 인력 리텐션", "condition_3":"규제 대응 로드맵",
-        "positive_factor_1":"성장 시장·핵심 고객 확보",
-        "positive_factor_2":"제품 경쟁력·가격 우위",
-        "positive_factor_3":"해외 확장 잠재력",
-        "negative_factor_1":"고객 집중·수요 변동",
-        "negative_factor_2":"규제·인증 지연 리스크",
-        "negative_factor_3":"운전자본 부담",
-        "action_short_1":"리파이낸싱 추진", "action_short_2":"계약 재협상", "action_short_3":"규제 컨설팅 착수",
-        "action_mid_1":"신규 사업부 KPI 관리", "action_mid_2":"리텐션 프로그램", "action_mid_3":"ESG 체계 구축",
-        "action_long_1":"IPO/M&A 준비", "action_long_2":"해외 채널 확장", "action_long_3":"정기 IR 체계",
-        "forecast_revenue": f"CAGR {ctx['cagr']}% 가정",
-        "forecast_profit": "영업이익률 점진 개선",
-        "forecast_debt_ratio": f"{pct(60,90,0)}% 목표",
-        "forecast_exit": f"{random.randint(3,5)}년 내 IPO/M&A",
-        # --- 부록/인터뷰/출처 ---
-        "fin_years": "5",
-        "income_sales_start": f"{revs[-5] if len(revs)>=5 else revs[0]}억", "income_sales_end": f"{revs[-1]}억",
-        "income_period": f"{len(ctx['years'])}년", "income_cagr": f"{ctx['cagr']}",
-        "balance_assets_start": f"{assets[-3]}억", "balance_assets_end": f"{assets[-1]}억",
-        "balance_debt_ratio_start": f"{int(dr[-3])}", "balance_debt_ratio_end": f"{int(dr[-1])}",
-        "cashflow_operating": f"{ctx['oper_cf'][-1]}억", "cashflow_investing": f"{ctx['invest_cf'][-1]}억", "cashflow_financing": f"{ctx['fin_cf'][-1]}억", "cashflow_year": f"{years[-1]}",
-        "division_1_name": ctx['prof']['products'][0], "division_1_sales": f"{int(revs[-1]*random.uniform(0.3,0.6))}억", "division_1_ratio": f"{pct(30,60,1)}", "division_1_margin": f"{pct(8,20,1)}",
-        "division_2_name": ctx['prof']['products'][1] if len(ctx['prof']['products'])>1 else "신사업", "division_2_sales": f"{int(revs[-1]*random.uniform(0.2,0.5))}억", "division_2_ratio": f"{pct(20,50,1)}", "division_2_margin": f"{pct(5,15,1)}",
-        "division_3_name": "서비스/유지보수", "division_3_sales": f"{int(revs[-1]*random.uniform(0.1,0.3))}억", "division_3_ratio": f"{pct(10,30,1)}", "division_3_margin": f"{pct(5,20,1)}",
-        "data_source_domestic":"KOSIS, 산업부, KRX", "data_source_global":"Bloomberg, Capital IQ", "data_source_report":"증권사 산업리포트", "data_source_internal":"내부 설문/조달 데이터",
-        "ceo_quote":"핵심 제품 해외 진출 가속", "ceo_note":"전략 고객 확보 최우선",
-        "cfo_name": person("CFO"), "cfo_quote":"유동성 리스크 선제 대응", "cfo_note":"만기 분산·금리 헤지",
-        "cto_name": person("CTO"), "cto_quote":"제품 신뢰성·효율 고도화", "cto_note":"인증 로드맵 추진",
-        "client_quote":"공급 안정성·기술 지원 중요", "client_note":"SLA 강화 필요",
-        "supplier_name": company_name().replace("주식회사 ",""), "supplier_quote":"단가·납기 협상 진행",
-        "law_name":"관련 법령", "law_year": str(yr()), "court_name":"○○지법",
-        "guideline_source":"정부 가이드라인", "guideline_year": str(yr()),
-        "email_date": f"{datetime.now().year}.{random.randint(1,12):02d}",
-        "cfo_memo":"단기 유동성 관리 필요",
-        "ceo_memo":"해외 파트너십·JV 협상 중",
-        "report_source":"산업 리포트", "report_year": str(yr()),
-        "paper_title":"학술 논문 제목", "paper_source":"저널명", "paper_year": str(yr()),
-        "news_title":"산업 동향 기사", "news_source":"Daily Biz", "news_date": f"{datetime.now().year}.{random.randint(1,12):02d}",
-        "harvard_citation":"Hong, J. (2024). Market.", "apa_citation":"Kim (2023). Journal, 12(2).",
-    }
-    return mapping.get(key)
+    h = _HANDLERS.get(key)
+    if h is None or isinstance(h, str): return h
+    return h(ctx, _known_view(ctx))
 
 # --- Fallback by token name (semantic heuristics) ---
 KW = {
@@ -879,25 +986,38 @@ KW = {
     "list": ["peers","clients","고객사","competitor","주주","shareholder","investors","업체","목록","list"],
     "text": ["note","memo","comment","설명","특징","리스크","전략","요약","배경","환경","구조","방안","조건"],
 }
+# 카테고리별 키워드를 정규식 하나로 (토큰마다 부분문자열 검사를 수십 번 돌리지 않도록)
+_KW_RE = {cat: re.compile("|".join(map(re.escape, words))) for cat, words in KW.items()}
+# fallback_by_name 의 판정 우선순위
+_KW_ORDER = ("money","pct","date","person","addr","name","list","text")
+
+# 같은 템플릿 토큰은 보고서마다 같은 카테고리 → 프로세스당 한 번만 판정
+@lru_cache(maxsize=None)
+def classify_token(k:str)->str:
+    for cat in _KW_ORDER:
+        if _KW_RE[cat].search(k): return cat
+    return "default"
+
 def fallback_by_name(token:str, ctx:dict):
     k = token.lower()
+    cat = classify_token(k)
     # money
-    if any(x in k for x in KW["money"]):
+    if cat == "money":
         return money_from_rev(ctx["revs"][-1], 0.01, 0.4)
-    if any(x in k for x in KW["pct"]):
+    if cat == "pct":
         return f"{pct(1,40,1)}%"
-    if any(x in k for x in KW["date"]):
+    if cat == "date":
         return f"{datetime.now().year + random.randint(0,5)}-{random.randint(1,12):02d}"
-    if any(x in k for x in KW["person"]):
+    if cat == "person":
         role = "임원" if "임원" in k else ("CEO" if "ceo" in k else ("CFO" if "cfo" in k else ("CTO" if "cto" in k else "담당")))
         return person(role)
-    if any(x in k for x in KW["addr"]):
+    if cat == "addr":
         return address()
-    if any(x in k for x in KW["name"]):
+    if cat == "name":
         return company_name().replace("주식회사 ","")
-    if any(x in k for x in KW["list"]):
+    if cat == "list":
         return klist()
-    if any(x in k for x in KW["text"]):
+    if cat == "text":
         return choice_sent([
             "내부 검토 결과에 따라 단계적 추진",
             "시장·규제 변동을 반영한 조건부 접근",
@@ -910,10 +1030,10 @@ def fallback_by_name(token:str, ctx:dict):
         "리스크 관리와 사업 확장 간 균형 필요"
     ])
 
-def build_mapping(tokens:list, seed=None):
+def build_mapping(tokens:list, seed=None, company_index=None):
     if seed is not None:
         random.seed(seed); Faker.seed(seed)
-    ctx = gen_context()
+    ctx = gen_context(company_index)
     mapping = {}
     # 프롬프트 토큰이 있을 경우 주입용 문자열
     def ai_prompt():
@@ -934,6 +1054,24 @@ def build_mapping(tokens:list, seed=None):
     return mapping, ctx
 
 # ---------------- Main ----------------
+def _one_report(job):
+    """보고서 1건 생성 (프로세스 풀 워커에서 실행되므로 최상위 함수로 둠)"""
+    template, out_path, seed, index, tokens = job
+    mapping, ctx = build_mapping(tokens, seed=seed, company_index=index)
+    replace_tokens_in_hwpx(template, out_path, mapping)
+    summary = {
+        "file": out_path.name,
+        "seed": seed,
+        "sector": ctx["sector"],
+        "scale": ctx["scale"],
+        "stage": ctx["stage"],
+        "revenue_last": ctx["revs"][-1],
+        "cagr": ctx["cagr"]
+    }
+    prompt = mapping.get("AI_PROMPT_FOR_FAKE") or mapping.get("LLM_PROMPT") or mapping.get("GEN_PROMPT")
+    # JSONL 한 줄 직렬화도 워커에서 끝내고 부모는 bytes 만 이어 씀
+    return _json_bytes(summary)+b"\n", prompt
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--template", required=True)
@@ -941,39 +1079,46 @@ def main():
     ap.add_argument("--count", type=int, default=5)
     ap.add_argument("--seed", type=int, default=None)
     ap.add_argument("--dump-jsonl", default="")
+    ap.add_argument("--no-cache", action="store_true", help="템플릿 토큰 캐시(.cache/) 사용 안 함")
+    ap.add_argument("--workers", type=int, default=os.cpu_count(), help="병렬 프로세스 수(1=순차 실행. 같은 시드면 워커 수와 관계없이 같은 결과)")
     args = ap.parse_args()
 
     template = Path(args.template)
     outdir = Path(args.out); outdir.mkdir(parents=True, exist_ok=True)
 
-    tokens = extract_tokens_from_hwpx(template)
+    tokens = extract_tokens_from_hwpx(template) if args.no_cache else cached_tokens(template)
     if not tokens: raise SystemExit("템플릿에서 토큰을 찾지 못했습니다.")
     print(f"[info] tokens: {len(tokens)}개")
 
     prefix="가짜투자보고서"; ext="hwpx"
-    existing=[int(m.group(1)) for p in glob(str(outdir/f"{prefix}_*.{ext}")) if (m:=re.search(rf"{prefix}_(\d+)\.{ext}$", Path(p).name))]
-    start=(max(existing) if existing else 0)+1
-
-    log = open(args.dump_jsonl,"a",encoding="utf-8") if args.dump_jsonl else None
-    for i in range(args.count):
-        seed = (args.seed or int(time.time())) + i
-        mapping, ctx = build_mapping(tokens, seed=seed)
-        out_path = outdir / f"{prefix}_{start+i:02d}.{ext}"
-        replace_tokens_in_hwpx(template, out_path, mapping)
-        if log:
-            log.write(json.dumps({
-                "file": out_path.name,
-                "seed": seed,
-                "sector": ctx["sector"],
-                "scale": ctx["scale"],
-                "stage": ctx["stage"],
-                "revenue_last": ctx["revs"][-1],
-                "cagr": ctx["cagr"]
-            }, ensure_ascii=False)+"\n")
-        if i==0:
-            # 콘솔에 프롬프트 예시 한 번만
-            print("\n[LLM PROMPT SAMPLE]\n", (mapping.get("AI_PROMPT_FOR_FAKE") or mapping.get("LLM_PROMPT") or mapping.get("GEN_PROMPT") or "템플릿에 프롬프트 토큰이 없습니다."))
-    if log: log.close()
+    # 기존 출력 번호 다음부터 (디렉터리 한 번 훑으며 접두/접미사 사이 숫자만 확인)
+    head, tail = f"{prefix}_", f".{ext}"
+    start=1
+    with os.scandir(outdir) as it:
+        for ent in it:
+            num=ent.name[len(head):-len(tail)]
+            if ent.name.startswith(head) and ent.name.endswith(tail) and num.isdecimal():
+                start=max(start, int(num)+1)
+
+    base_seed = args.seed or int(time.time())
+    jobs = [(template, outdir / f"{prefix}_{start+i:02d}.{ext}", base_seed + i, i, tokens) for i in range(args.count)]
+
+    log = open(args.dump_jsonl,"ab",buffering=1<<20) if args.dump_jsonl else None
+    ex = None
+    if args.workers and args.workers > 1:
+        _faker()  # fork 방식이면 워커가 초기화된 인스턴스를 그대로 물려받음
+        ex = ProcessPoolExecutor(max_workers=args.workers)
+    try:
+        results = ex.map(_one_report, jobs, chunksize=4) if ex else map(_one_report, jobs)
+        for i, (line, prompt) in enumerate(results):
+            if log:
+                log.write(line)
+            if i==0:
+                # 콘솔에 프롬프트 예시 한 번만
+                print("\n[LLM PROMPT SAMPLE]\n", (prompt or "템플릿에 프롬프트 토큰이 없습니다."))
+    finally:
+        if ex: ex.shutdown()
+        if log: log.close()
     print("[done] 출력 폴더:", outdir)
 
 if __name__ == "__main__":
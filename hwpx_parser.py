@@ -28,6 +28,8 @@ except Exception:
 OLE_SIG = b"\xD0\xCF\x11\xE0"
 ZIP_SIG = b"PK\x03\x04"
 HWPTAG_PARA_TEXT = 66
+# 문단 텍스트의 제어문자(탭/줄바꿈 제외)를 공백으로 바꾸는 translate 테이블
+_CTRL_TABLE = {i: " " for i in range(0x20) if i not in (0x09, 0x0A)}
 
 def detect_container(p: Path) -> str:
     if not p.is_file():
@@ -49,19 +51,23 @@ def _read_fileheader(ole: "olefile.OleFileIO") -> dict:
     attr1, = struct.unpack("<I", raw[36:40])  # bit0=compressed, bit1=encrypted
     return {"compressed": bool(attr1 & 1), "encrypted": bool(attr1 & 2), "ver": ver}
 
+_U32 = struct.Struct("<I")
+
 def _iter_records(buf: bytes):
-    off, n = 0, len(buf)
+    """(tag, payload) 순회. payload 는 복사 없는 memoryview 조각 (필요한 쪽에서만 bytes/str 로 변환)"""
+    mv, unpack_from = memoryview(buf), _U32.unpack_from
+    off, n = 0, len(mv)
     while off + 4 <= n:
-        (hdr,) = struct.unpack("<I", buf[off:off+4]); off += 4
+        (hdr,) = unpack_from(mv, off); off += 4
         tag   =  hdr        & 0x3FF
         size  = (hdr >> 20) & 0xFFF
         if size == 0xFFF:
             if off + 4 > n: break
-            (size,) = struct.unpack("<I", buf[off:off+4]); off += 4
+            (size,) = unpack_from(mv, off); off += 4
         if off + size > n:
-            payload = buf[off:n]; off = n
+            payload = mv[off:n]; off = n
         else:
-            payload = buf[off:off+size]; off += size
+            payload = mv[off:off+size]; off += size
         yield tag, payload
 
 def _zlib_if_needed(raw: bytes, expect: bool) -> bytes:
@@ -85,15 +91,20 @@ def extract_hwp_lines(path: Path) -> list[str]:
                 raw = fp.read()
             data = _zlib_if_needed(raw, hdr["compressed"])
             # 레코드 순회: 문단 텍스트(66)마다 줄 하나
+            # 레코드마다 디코드하지 않고 UTF-16LE 줄바꿈으로 이어 붙여 섹션당 한 번만 디코드
+            text = bytearray()
             for tag, payload in _iter_records(data):
                 if tag == HWPTAG_PARA_TEXT:
-                    s = payload.decode("utf-16le", errors="ignore")
-                    s = s.replace("\r","\n")
-                    # 빈 줄 제거, 제어문자 제거
-                    for ln in s.split("\n"):
-                        ln = "".join(ch if (ch >= " " or ch in "\t") else " " for ch in ln).strip()
-                        if ln:
-                            out.append(ln)
+                    text += payload[:len(payload) & ~1]  # 홀수 길이 끝 바이트는 (개별 디코드 때처럼) 버림
+                    text += b"\n\x00"
+            s = str(text, "utf-16le", "ignore")
+            # 제어문자 → 공백 (문자 단위 루프 대신 C 레벨 translate)
+            s = s.replace("\r","\n").translate(_CTRL_TABLE)
+            # 빈 줄 제거
+            for ln in s.split("\n"):
+                ln = ln.strip()
+                if ln:
+                    out.append(ln)
     return out
 
 # ---------------- HWPX (.hwpx) ----------------
@@ -109,64 +120,72 @@ _PARA_END = {
 _BR = {"br","linebreak"}
 # 표 관련 요소에서 최소 줄바꿈: 행/셀 시작 전후로 잘라주면 세로 정렬에 유리
 _TABLE_BREAK = {"tbl","table","tr","row","tc","cell","th","thead","tbody","tfoot"}
+_WS_RE = re.compile(r"[ \t\u00A0]{2,}")
 
 def extract_hwpx_lines(path: Path) -> list[str]:
     out: list[str] = []
     with zipfile.ZipFile(str(path)) as z:
-        sections = sorted([n for n in z.namelist()
-                           if n.startswith("Contents/section") and n.endswith(".xml")])
+        xmls = [n for n in z.namelist() if n.lower().endswith(".xml")]
+        sections = sorted([n for n in xmls if n.startswith("Contents/section") and n.endswith(".xml")])
         if not sections:
-            sections = sorted([n for n in z.namelist() if n.lower().endswith(".xml")])
+            # 비표준 경로: 본문일 법한 이름만 (헤더/설정/매니페스트 등 보조 XML 은 건너뜀),
+            # 그런 이름도 없을 때만 모든 XML
+            sections = sorted([n for n in xmls if "section" in n.lower() or "body" in n.lower()]) or sorted(xmls)
 
-        for name in sections:
-            try:
-                root = ET.fromstring(z.read(name))
-            except Exception:
-                continue
+        lnames: dict[str, str] = {}  # 태그 → 로컬명(소문자) 캐시
+        ws_sub = _WS_RE.sub
 
+        for name in sections:
+            lines: list[str] = []  # 파싱에 실패한 섹션은 통째로 건너뛰도록 섹션 단위로 모음
             buf: list[str] = []  # 현재 문단/셀 버퍼
 
             def flush():
                 # 버퍼 → 한 줄
-                nonlocal buf
+                if not buf: return
                 line = "".join(buf)
-                # 연속 공백 정리
-                line = re.sub(r"[ \t\u00A0]{2,}", " ", line)
+                buf.clear()
+                # 연속 공백 정리 (공백류가 두 개 이상 붙을 수 있을 때만)
+                if "  " in line or "\t" in line or "\u00A0" in line:
+                    line = ws_sub(" ", line)
                 line = line.strip()
                 if line:
-                    out.append(line)
-                buf = []
-
-            # 깊이우선 순회
-            stack = [root]
-            while stack:
-                node = stack.pop()
-                # 노드의 텍스트
-                if node.text:
-                    buf.append(node.text)
-
-                lname = _lname(node.tag).lower()
-                if lname in _BR:
-                    flush()
-                # 표 요소에서 살짝 잘라 넣기 (셀/행/표 경계)
-                if lname in _TABLE_BREAK:
-                    flush()
-
-                # 자식 push (역순으로 push하여 원래 순서대로 pop)
-                children = list(node)
-                for child in reversed(children):
-                    stack.append(child)
-
-                # 노드 종료 텍스트 tail
-                if node.tail:
-                    buf.append(node.tail)
-
-                # 문단/목록 항목/제목 계열 끝나면 줄바꿈
-                if lname in _PARA_END:
-                    flush()
+                    lines.append(line)
+
+            # 스트리밍 파싱: 전체 트리를 올리지 않고 처리한 요소는 바로 비움
+            # (start 시점엔 text, end 시점엔 tail 이 아직 안 채워졌을 수 있어 다음 이벤트에서 읽음)
+            text_of = tail_of = None
+            try:
+                with z.open(name) as fp:
+                    for ev, node in ET.iterparse(fp, events=("start", "end")):
+                        if text_of is not None:
+                            if text_of.text: buf.append(text_of.text)
+                            text_of = None
+                        if tail_of is not None:
+                            if tail_of.tail: buf.append(tail_of.tail)
+                            tail_of.clear(); tail_of = None
+
+                        lname = lnames.get(node.tag)
+                        if lname is None:
+                            lname = lnames[node.tag] = _lname(node.tag).lower()
+                        if ev == "start":
+                            # 줄바꿈/표 요소(셀/행/표 경계)에서 잘라 넣기
+                            if lname in _BR or lname in _TABLE_BREAK:
+                                flush()
+                            text_of = node
+                        else:
+                            if text_of is node:  # 자식 없는 요소의 text
+                                if node.text: buf.append(node.text)
+                                text_of = None
+                            # 문단/목록 항목/제목 계열, 표 요소 끝나면 줄바꿈
+                            if lname in _PARA_END or lname in _TABLE_BREAK:
+                                flush()
+                            tail_of = node
+            except (ET.ParseError, zipfile.BadZipFile, zlib.error, OSError):  # 손상된 멤버는 해당 섹션만 건너뜀
+                continue
 
             # 섹션 끝나고 남은 버퍼
             flush()
+            out.extend(lines)
 
     return out
 
@@ -175,19 +194,23 @@ def hard_wrap_lines(lines: list[str], width: int) -> list[str]:
     if width <= 0: return lines
     wrapped: list[str] = []
     for ln in lines:
-        s = ln
-        while len(s) > width:
+        # 남은 부분을 매번 잘라 복사하지 않고 시작 위치(i)만 옮겨 가며 탐색
+        s, i, n = ln, 0, len(ln)
+        while n - i > width:
+            end = i + width
             # 문장부호/공백 기준으로 자연스레 자르기
-            cut = s.rfind(" ", 0, width)
+            cut = s.rfind(" ", i, end)
+            cut = cut - i if cut >= 0 else -1
             if cut < width * 0.6:
                 # 공백이 없으면 문장부호 시도
                 for p in (". ", ") ", "] ", "· ", "• ", ", "):
-                    pos = s.rfind(p, 0, width)
-                    if pos > 0: cut = pos + len(p)-1; break
+                    pos = s.rfind(p, i, end)
+                    if pos > i: cut = pos - i + len(p)-1; break
             if cut <= 0: cut = width
-            wrapped.append(s[:cut].rstrip())
-            s = s[cut:].lstrip()
-        if s: wrapped.append(s)
+            wrapped.append(s[i:i+cut].rstrip())
+            i += cut
+            while i < n and s[i].isspace(): i += 1
+        if i < n: wrapped.append(s[i:] if i else s)
     return wrapped
 
 # ---------------- 메인 ----------------